@@ -0,0 +1,132 @@
+"""Throughput of `ResultChannel` against the standard library queues.
+
+Run with ``python -m benchmarks.bench_channel``. One producer sends
+`--count` results through a bounded channel to one consumer, item by item
+or in batches of `--batch`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import queue
+import threading
+import time
+import typing as t
+
+from optionresult import Err, Ok
+from optionresult.channel import AsyncResultChannel, ResultChannel
+
+from .common import header, report
+
+
+def make_items(n: int) -> list[Ok[int, str] | Err[int, str]]:
+    return [Err("boom") if i % 1000 == 0 else Ok(i) for i in range(n)]
+
+
+def timed_threads(produce: t.Callable[[], None], consume: t.Callable[[], None]) -> float:
+    producer = threading.Thread(target=produce)
+    start = time.perf_counter()
+    producer.start()
+    consume()
+    producer.join()
+    return time.perf_counter() - start
+
+
+def thread_variants(items: list[t.Any], capacity: int, batch: int) -> dict[str, float]:
+    n = len(items)
+    timings = {}
+
+    q: queue.Queue[t.Any] = queue.Queue(capacity)
+    timings["queue.Queue"] = timed_threads(lambda: [q.put(item) for item in items], lambda: [q.get() for _ in range(n)])
+
+    channel: ResultChannel[int, str] = ResultChannel(capacity)
+    timings["ResultChannel"] = timed_threads(lambda: [channel.put(item) for item in items], lambda: [channel.get() for _ in range(n)])
+
+    channel = ResultChannel(capacity)
+
+    def produce_batches() -> None:
+        for i in range(0, n, batch):
+            channel.put_many(items[i : i + batch])
+
+    def consume_batches() -> None:
+        received = 0
+        while received < n:
+            received += len(channel.get_many(batch))
+
+    timings[f"ResultChannel batch={batch}"] = timed_threads(produce_batches, consume_batches)
+    return timings
+
+
+def async_variants(items: list[t.Any], capacity: int, batch: int) -> dict[str, float]:
+    n = len(items)
+
+    async def run(produce: t.Callable[[], t.Awaitable[None]], consume: t.Callable[[], t.Awaitable[None]]) -> float:
+        start = time.perf_counter()
+        await asyncio.gather(produce(), consume())
+        return time.perf_counter() - start
+
+    async def main() -> dict[str, float]:
+        timings = {}
+        q: asyncio.Queue[t.Any] = asyncio.Queue(capacity)
+
+        async def put_queue() -> None:
+            for item in items:
+                await q.put(item)
+
+        async def get_queue() -> None:
+            for _ in range(n):
+                await q.get()
+
+        timings["asyncio.Queue"] = await run(put_queue, get_queue)
+
+        channel: AsyncResultChannel[int, str] = AsyncResultChannel(capacity)
+
+        async def put_single() -> None:
+            for item in items:
+                await channel.put(item)
+
+        async def get_single() -> None:
+            for _ in range(n):
+                await channel.get()
+
+        timings["AsyncResultChannel"] = await run(put_single, get_single)
+
+        channel = AsyncResultChannel(capacity)
+
+        async def put_batches() -> None:
+            for i in range(0, n, batch):
+                await channel.put_many(items[i : i + batch])
+
+        async def get_batches() -> None:
+            received = 0
+            while received < n:
+                received += len(await channel.get_many(batch))
+
+        timings[f"AsyncResultChannel batch={batch}"] = await run(put_batches, get_batches)
+        return timings
+
+    return asyncio.run(main())
+
+
+def main(argv: t.Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--capacity", type=int, default=1024)
+    parser.add_argument("--batch", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    header("bench_channel")
+    items = make_items(args.count)
+    for title, variants in (("threads", thread_variants), ("asyncio", async_variants)):
+        timings = variants(items, args.capacity, args.batch)
+        baseline = next(iter(timings.values()))
+        print(f"\n{title}")
+        report(
+            [(name, f"{args.count / elapsed:,.0f}", baseline / elapsed) for name, elapsed in timings.items()],
+            ("channel", "items/s", "speedup"),
+        )
+
+
+if __name__ == "__main__":
+    main()
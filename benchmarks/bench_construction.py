@@ -0,0 +1,48 @@
+"""Single-thread construction cost of `Option`, `Ok` and `Err`.
+
+Run with ``python -m benchmarks.bench_construction``. Construction is the
+hottest path in the library, so compare these absolute numbers across
+changes; `bench_threads` only shows how throughput scales.
+"""
+
+from __future__ import annotations
+
+import argparse
+import typing as t
+
+from optionresult import Err, Ok, Option
+
+from .common import best_of, header, report
+
+
+class Plain:
+    """A mutable class with one attribute, as a reference point."""
+
+    def __init__(self, value: object) -> None:
+        self.value = value
+
+
+def main(argv: t.Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args(argv)
+    n = args.iterations
+
+    header("bench_construction")
+    rows = []
+    baseline = None
+    for name, cls, value in (
+        ("plain class", Plain, 1),
+        ("Option(1)", Option, 1),
+        ("Option(None)", Option, None),
+        ("Ok(1)", Ok, 1),
+        ("Err(1)", Err, 1),
+    ):
+        per_call = best_of(lambda: [cls(value) for _ in range(n)]) / n
+        baseline = baseline or per_call
+        rows.append((name, f"{per_call * 1e9:,.0f}", per_call / baseline))
+    report(rows, ("constructor", "ns/call", "relative"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Cost of attaching error context on success-heavy paths.
+
+Run with ``python -m benchmarks.bench_context``. Every variant runs the same
+`Result.of` call, which succeeds, so the context is never rendered.
+"""
+
+from __future__ import annotations
+
+import argparse
+import typing as t
+
+from optionresult import Result
+
+from .common import best_of, header, report
+
+PATH = "/etc/service/config.toml"
+
+
+def variants() -> dict[str, t.Callable[[], object]]:
+    return {
+        "no context": lambda: Result.of(int, "8080"),
+        "eager f-string": lambda: Result.of(int, "8080").context(f"reading port from {PATH}"),
+        "context(msg)": lambda: Result.of(int, "8080").context("reading port"),
+        "context(fmt, *args)": lambda: Result.of(int, "8080").context("reading port from {}", PATH),
+        "with_context(lambda)": lambda: Result.of(int, "8080").with_context(lambda: f"reading port from {PATH}"),
+    }
+
+
+def main(argv: t.Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args(argv)
+    n = args.iterations
+
+    header("bench_context")
+    rows = []
+    baseline = None
+    for name, fn in variants().items():
+        elapsed = best_of(lambda: [fn() for _ in range(n)])
+        baseline = baseline or elapsed
+        rows.append((name, f"{elapsed / n * 1e9:,.0f}", elapsed / baseline))
+    report(rows, ("variant", "ns/call", "relative"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Latency added by deadline support to `Result.of`.
+
+Run with ``python -m benchmarks.bench_deadline``. The stub function returns
+immediately, so the numbers are the per-call cost of each path: `Result.of`
+as it was before deadlines existed, the no-timeout fast path, a call inside
+an unexpired `deadline(...)`, and an explicit `within=` that goes through
+the shared thread pool.
+"""
+
+from __future__ import annotations
+
+import argparse
+import typing as t
+
+from optionresult import Err, Ok, Result
+from optionresult.deadline import deadline
+
+from .common import best_of, header, report
+
+
+def stub(x: int) -> int:
+    return x
+
+
+def previous_of(fn: t.Callable[..., t.Any], *args: t.Any, catch: t.Type[Exception] = Exception, **kwargs: t.Any) -> t.Any:
+    try:
+        return Ok(fn(*args, **kwargs))
+    except catch as exc:
+        return Err(exc)
+
+
+def main(argv: t.Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200_000)
+    parser.add_argument("--pooled-iterations", type=int, default=5_000)
+    args = parser.parse_args(argv)
+    n, m = args.iterations, args.pooled_iterations
+
+    def direct() -> None:
+        for _ in range(n):
+            stub(1)
+
+    def previous() -> None:
+        for _ in range(n):
+            previous_of(stub, 1)
+
+    def fast_path() -> None:
+        for _ in range(n):
+            Result.of(stub, 1)
+
+    def pooled() -> None:
+        for _ in range(m):
+            Result.of(stub, 1, within=10)
+
+    def scoped() -> None:
+        with deadline(60):
+            for _ in range(m):
+                Result.of(stub, 1)
+
+    header("bench_deadline")
+    baseline = best_of(direct) / n
+    rows = [("direct call", f"{baseline * 1e9:,.0f}", 1.0)]
+    for name, fn, count in (
+        ("Result.of before deadlines", previous, n),
+        ("Result.of, no timeout", fast_path, n),
+        ("Result.of, within=", pooled, m),
+        ("inside deadline()", scoped, m),
+    ):
+        per_call = best_of(fn) / count
+        rows.append((name, f"{per_call * 1e9:,.0f}", per_call / baseline))
+    report(rows, ("variant", "ns/call", "relative"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Overhead of `Err` provenance tracing on a combinator chain.
+
+Run with ``python -m benchmarks.bench_provenance``. The "disabled" row is
+measured after tracing was switched on and off again and should match the
+"never enabled" baseline; the script exits non-zero if it does not.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import typing as t
+
+from optionresult import Err, Ok, Result, provenance
+
+from .common import best_of, header, report
+
+
+def chain(n: int) -> None:
+    for i in range(n):
+        Result.of(int, "x" if i % 2 else "1").map(lambda x: x + 1).and_then(Ok).map_err(str).or_else(Err).unwrap_or(0)
+
+
+def main(argv: t.Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50_000)
+    parser.add_argument("--tolerance", type=float, default=0.05, help="allowed slowdown when tracing is disabled")
+    args = parser.parse_args(argv)
+
+    header("bench_provenance")
+    baseline = best_of(lambda: chain(args.iterations))
+    rows = [("never enabled", baseline, 1.0)]
+    backends = [False, True] if hasattr(sys, "monitoring") else [False]
+    for monitoring in backends:
+        name = "monitoring" if monitoring else "patch"
+        with provenance.tracing(monitoring=monitoring):
+            enabled = best_of(lambda: chain(args.iterations))
+        rows.append((f"enabled ({name})", enabled, enabled / baseline))
+    disabled = best_of(lambda: chain(args.iterations))
+    rows.append(("disabled", disabled, disabled / baseline))
+    report(rows, ("mode", "seconds", "relative"))
+
+    if disabled / baseline > 1 + args.tolerance:
+        sys.exit(f"disabled tracing is {disabled / baseline - 1:.1%} slower than the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Pipeline throughput against live calls versus a replayed recording.
+
+Run with ``python -m benchmarks.bench_replay``. The "live" dependency is a
+local stub that sleeps for `--latency` seconds and fails one call in ten.
+Replay serves the recorded outcomes from the memory-mapped file, first as
+fast as possible and then with the recorded latencies simulated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+import typing as t
+
+from optionresult import Result
+from optionresult.replay import Recorder, Replayer
+
+from .common import header, report
+
+
+def main(argv: t.Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2_000)
+    parser.add_argument("--keys", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0002)
+    args = parser.parse_args(argv)
+
+    def dependency(key: int) -> dict[str, int]:
+        time.sleep(args.latency)
+        if key % 10 == 0:
+            raise LookupError(key)
+        return {"key": key, "size": key * 3}
+
+    def pipeline() -> int:
+        return sum(Result.of(dependency, i % args.keys).map(lambda row: row["size"]).unwrap_or(0) for i in range(args.calls))
+
+    def timed(fn: t.Callable[[], int]) -> tuple[float, int]:
+        start = time.perf_counter()
+        total = fn()
+        return time.perf_counter() - start, total
+
+    header("bench_replay")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "calls.orr")
+        rows = []
+        with Recorder(path):
+            elapsed, expected = timed(pipeline)
+        rows.append(("live (recording)", f"{args.calls / elapsed:,.0f}", 1.0))
+        live = elapsed
+        for name, scale in (("replay", 0.0), ("replay, simulated latency", 1.0)):
+            with Replayer(path, latency_scale=scale):
+                elapsed, total = timed(pipeline)
+            assert total == expected
+            rows.append((name, f"{args.calls / elapsed:,.0f}", live / elapsed))
+        size = os.path.getsize(path)
+    report(rows, ("mode", "calls/s", "speedup"))
+    print(f"recording: {args.calls:,} calls in {size:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Compiled schema parsers against hand-written per-field `Result.of` chains.
+
+Run with ``python -m benchmarks.bench_schema``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import typing as t
+
+from optionresult import Err, Ok, Result, compile_parser
+
+from .common import best_of, header, report
+
+
+@dataclasses.dataclass
+class Order:
+    id: int
+    sku: str
+    quantity: int
+    price: float
+    note: t.Optional[str] = None
+
+
+def chained(data: t.Mapping[str, t.Any]) -> Ok[Order, Exception] | Err[Order, Exception]:
+    return (
+        Result.of(lambda: int(data["id"]))
+        .and_then(lambda order_id: Result.of(lambda: str(data["sku"])).map(lambda sku: (order_id, sku)))
+        .and_then(lambda acc: Result.of(lambda: int(data["quantity"])).map(lambda quantity: (*acc, quantity)))
+        .and_then(lambda acc: Result.of(lambda: float(data["price"])).map(lambda price: (*acc, price)))
+        .map(lambda acc: Order(*acc, note=data.get("note")))
+    )
+
+
+PAYLOADS = {
+    "valid": {"id": 1, "sku": "A-1", "quantity": "3", "price": 9.5},
+    "invalid": {"id": 1, "sku": "A-1", "quantity": "three", "price": 9.5},
+}
+
+
+def main(argv: t.Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args(argv)
+    n = args.iterations
+
+    header("bench_schema")
+    parsers = {
+        "Result.of chain": chained,
+        "compile_parser": compile_parser(Order),
+        "compile_parser(collect_all)": compile_parser(Order, collect_all=True),
+    }
+    rows = []
+    for payload_name, payload in PAYLOADS.items():
+        baseline = None
+        for name, parse in parsers.items():
+            elapsed = best_of(lambda: [parse(payload) for _ in range(n)])
+            baseline = baseline or elapsed
+            rows.append((payload_name, name, f"{n / elapsed:,.0f}", baseline / elapsed))
+    report(rows, ("payload", "parser", "records/s", "speedup"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Shared-memory transport of results against pickling them through a Queue.
+
+Run with ``python -m benchmarks.bench_shm``. Each mode sends the same list
+of results to a freshly spawned consumer process that touches every item;
+the consumer reports its peak RSS.
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+import typing as t
+
+from optionresult import Err, Ok
+from optionresult.shm import SharedResults, pack_results
+
+from .common import header, report
+
+
+def make_results(n: int, payload: int) -> list[Ok[t.Any, t.Any] | Err[t.Any, t.Any]]:
+    blob = b"x" * payload
+    results: list[Ok[t.Any, t.Any] | Err[t.Any, t.Any]] = []
+    for i in range(n):
+        if i % 100 == 0:
+            results.append(Err(ValueError(f"item {i}")))
+        elif i % 2:
+            results.append(Ok(blob))
+        else:
+            results.append(Ok(i))
+    return results
+
+
+def peak_rss_mib() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    return rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def consume_queue(queue: t.Any, done: t.Any) -> None:
+    results = queue.get()
+    errors = sum(result.is_err() for result in results)
+    done.put((errors, peak_rss_mib()))
+
+
+def consume_shm(queue: t.Any, done: t.Any) -> None:
+    shared: SharedResults = queue.get()
+    errors = sum(result.is_err() for result in shared)
+    shared.close()
+    done.put((errors, peak_rss_mib()))
+
+
+def run(target: t.Callable[[t.Any, t.Any], None], send: t.Callable[[t.Any], t.Any]) -> tuple[float, int, float]:
+    ctx = multiprocessing.get_context("spawn")
+    queue, done = ctx.Queue(), ctx.Queue()
+    process = ctx.Process(target=target, args=(queue, done))
+    process.start()
+    # let the interpreter start up so only the transfer is timed
+    time.sleep(1.0)
+    start = time.perf_counter()
+    keep = send(queue)
+    errors, rss = done.get()
+    elapsed = time.perf_counter() - start
+    process.join()
+    del keep
+    return elapsed, errors, rss
+
+
+def main(argv: t.Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--payload", type=int, default=64, help="size of the bytes payloads")
+    args = parser.parse_args(argv)
+
+    header("bench_shm")
+    results = make_results(args.count, args.payload)
+
+    def send_list(queue: t.Any) -> None:
+        queue.put(results)
+
+    def send_shared(queue: t.Any) -> SharedResults:
+        shared = pack_results(results)
+        queue.put(shared)
+        return shared
+
+    rows = []
+    elapsed, errors, rss = run(consume_queue, send_list)
+    rows.append(("pickled list via Queue", elapsed, errors, rss))
+    shared: list[SharedResults] = []
+    elapsed, errors, rss = run(consume_shm, lambda queue: shared.append(send_shared(queue)))
+    for segment in shared:
+        segment.close()
+        segment.unlink()
+    rows.append(("pack_results + attach", elapsed, errors, rss))
+    report(rows, ("mode", "seconds", "errors", "consumer peak RSS (MiB)"))
+
+
+if __name__ == "__main__":
+    main()
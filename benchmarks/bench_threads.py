@@ -0,0 +1,97 @@
+"""Throughput scaling of shared `Option`/`Result` instances across threads.
+
+Run with ``python -m benchmarks.bench_threads``. On a free-threaded build
+the ops/s column should grow with the thread count; with the GIL it stays
+roughly flat.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import threading
+import time
+import typing as t
+
+from optionresult import Err, Ok, Option
+
+from .common import header, report
+
+SOME = Option(42)
+NONE = Option(None)
+OK = Ok(42)
+ERR = Err(ValueError("shared"))
+
+
+def construction(n: int) -> None:
+    for i in range(n):
+        Option(i)
+        Ok(i)
+        Err(i)
+
+
+def combinators(n: int) -> None:
+    for _ in range(n):
+        SOME.map(lambda v: v + 1).and_then(Option).unwrap_or(0)
+        NONE.or_(SOME).filter(bool)
+        OK.map(lambda v: v + 1).and_then(Ok).unwrap_or(0)
+        ERR.map(abs).or_else(lambda e: OK)
+
+
+def equality(n: int) -> None:
+    other_some = Option(42)
+    other_ok = Ok(42)
+    other_err = Err(ValueError("shared"))
+    for _ in range(n):
+        SOME == other_some  # noqa: B015
+        OK == other_ok  # noqa: B015
+        ERR == other_err  # noqa: B015
+
+
+WORKLOADS: t.Dict[str, t.Callable[[int], None]] = {
+    "construction": construction,
+    "combinators": combinators,
+    "equality": equality,
+}
+
+
+def run(workload: t.Callable[[int], None], threads: int, iterations: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        workload(iterations)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main(argv: t.Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1, help="maximum number of threads")
+    parser.add_argument("--iterations", type=int, default=20_000, help="iterations per thread")
+    parser.add_argument("--workload", choices=sorted(WORKLOADS), action="append", help="workloads to run (default: all)")
+    args = parser.parse_args(argv)
+
+    header("bench_threads")
+    counts = sorted({1, *(2**i for i in range(1, args.threads.bit_length())), args.threads})
+    for name in args.workload or WORKLOADS:
+        rows = []
+        baseline = None
+        for threads in counts:
+            elapsed = run(WORKLOADS[name], threads, args.iterations)
+            ops = threads * args.iterations / elapsed
+            baseline = baseline or ops
+            rows.append((threads, f"{ops:,.0f}", ops / baseline))
+        print(f"\n{name}")
+        report(rows, ("threads", "ops/s", "scaling"))
+
+
+if __name__ == "__main__":
+    main()
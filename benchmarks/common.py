@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import sys
+import time
+import typing as t
+
+
+def gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def header(title: str) -> None:
+    build = "GIL" if gil_enabled() else "free-threaded"
+    print(f"{title} ({sys.implementation.name} {sys.version.split()[0]}, {build})")
+
+
+def best_of(fn: t.Callable[[], object], repeat: int = 5) -> float:
+    """Return the fastest of `repeat` wall-clock timings of `fn()`, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(rows: t.Iterable[t.Sequence[object]], columns: t.Sequence[str]) -> None:
+    table = [list(map(str, columns))] + [[f"{cell:.3f}" if isinstance(cell, float) else str(cell) for cell in row] for row in rows]
+    widths = [max(len(row[i]) for row in table) for i in range(len(columns))]
+    for row in table:
+        print("  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
@@ -1,3 +1,6 @@
-from .exceptions import PanicError  # noqa: F401
+from .exceptions import ChannelClosedError, ContextError, DeadlineExceeded, PanicError, ReplayMissError, SchemaError  # noqa: F401
+from .fingerprint import ErrorGroup, ErrorIndex, Fingerprint  # noqa: F401
+from .lazy import LazyOption, LazyResult, Slot  # noqa: F401
 from .option import Option  # noqa: F401
 from .result import Err, Ok, Result  # noqa: F401
+from .schema import FieldError, compile_parser  # noqa: F401
@@ -0,0 +1,253 @@
+"""Bounded channels that carry `Ok`/`Err` values between producers and consumers.
+
+`ResultChannel` is for threads and `AsyncResultChannel` for asyncio tasks;
+both share the same semantics:
+
+- `put` blocks while the channel holds `capacity` items (0 means unbounded).
+- `put_many`/`get_many` move whole batches under a single lock acquisition.
+  A batch that fits within `capacity` is all-or-nothing: it waits until
+  there is room for every item, so a timeout or close leaves nothing of it
+  queued. Larger batches go in as room frees up; if one is interrupted the
+  exception's `delivered` attribute says how many items were queued.
+- With `prioritize_errors=True`, `Err`s travel in their own lane and are
+  received before any queued `Ok`s. Otherwise items keep their order.
+- `close(error)` stops further puts. Consumers drain what is queued, one of
+  them then receives `Err(error)` if one was given, and after that every
+  receive raises `ChannelClosedError`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import threading
+import time
+import typing as t
+
+from .exceptions import ChannelClosedError
+from .result import Err
+
+if t.TYPE_CHECKING:
+    from .result import Ok  # pragma: no cover
+
+T = t.TypeVar("T")
+E = t.TypeVar("E")
+X = t.TypeVar("X", bound=BaseException)
+
+
+def _interrupted(exc: X, delivered: int) -> X:
+    exc.delivered = delivered  # type: ignore[attr-defined]
+    return exc
+
+
+class _State(t.Generic[T, E]):
+    """Lock-free bookkeeping shared by both channel flavours; callers hold the lock."""
+
+    def __init__(self, capacity: int, prioritize_errors: bool) -> None:
+        if capacity < 0:
+            raise ValueError("capacity must be >= 0")
+        self.capacity = capacity
+        self.prioritize_errors = prioritize_errors
+        self.oks: t.Deque[Ok[T, E] | Err[T, E]] = collections.deque()
+        self.errs: t.Deque[Ok[T, E] | Err[T, E]] = collections.deque()
+        self.closed = False
+        self.final: Err[T, E] | None = None
+
+    def __len__(self) -> int:
+        return len(self.oks) + len(self.errs)
+
+    def space(self) -> int:
+        if self.capacity == 0:
+            return -1
+        return self.capacity - len(self)
+
+    def needed(self, pending: int, total: int) -> int:
+        """Room to wait for before pushing: all of a batch that fits, otherwise any."""
+        return pending if total <= self.capacity else 1
+
+    def has_room(self, needed: int) -> bool:
+        space = self.space()
+        return space < 0 or space >= needed
+
+    def push(self, items: t.Sequence[Ok[T, E] | Err[T, E]]) -> None:
+        if not self.prioritize_errors:
+            self.oks.extend(items)
+            return
+        for item in items:
+            (self.errs if item.is_err() else self.oks).append(item)
+
+    def pop(self, n: int) -> list[Ok[T, E] | Err[T, E]]:
+        items: list[Ok[T, E] | Err[T, E]] = []
+        for lane in (self.errs, self.oks):
+            while lane and len(items) < n:
+                items.append(lane.popleft())
+        return items
+
+    def take_final(self) -> list[Ok[T, E] | Err[T, E]]:
+        if self.final is None:
+            raise ChannelClosedError("receive on a closed and drained channel")
+        final, self.final = self.final, None
+        return [final]
+
+    def close(self, error: E | None) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        if error is not None:
+            self.final = Err(error)
+
+
+class ResultChannel(t.Generic[T, E]):
+    def __init__(self, capacity: int = 0, *, prioritize_errors: bool = False) -> None:
+        self._state: _State[T, E] = _State(capacity, prioritize_errors)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    @property
+    def closed(self) -> bool:
+        return self._state.closed
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+    def put(self, item: Ok[T, E] | Err[T, E], timeout: float | None = None) -> None:
+        self.put_many((item,), timeout)
+
+    def put_many(self, items: t.Iterable[Ok[T, E] | Err[T, E]], timeout: float | None = None) -> None:
+        """Put every item, blocking for room as needed; batches larger than the capacity go in chunks."""
+        pending = list(items)
+        total = len(pending)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        state = self._state
+        with self._not_full:
+            while pending:
+                needed = state.needed(len(pending), total)
+                while True:
+                    if state.closed:
+                        raise _interrupted(ChannelClosedError("send on a closed channel"), total - len(pending))
+                    if state.has_room(needed):
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise _interrupted(TimeoutError("timed out waiting for room in the channel"), total - len(pending))
+                    self._not_full.wait(remaining)
+                space = state.space()
+                batch = pending if space < 0 else pending[:space]
+                pending = [] if space < 0 else pending[space:]
+                state.push(batch)
+                self._not_empty.notify(len(batch))
+
+    def get(self, timeout: float | None = None) -> Ok[T, E] | Err[T, E]:
+        return self.get_many(1, timeout)[0]
+
+    def get_many(self, max_items: int, timeout: float | None = None) -> list[Ok[T, E] | Err[T, E]]:
+        """Wait for at least one item and return up to `max_items` of them."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        state = self._state
+        with self._not_empty:
+            while not state:
+                if state.closed:
+                    return state.take_final()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("timed out waiting for an item")
+                self._not_empty.wait(remaining)
+            items = state.pop(max_items)
+            # wake every producer: the first in line may need more room than was freed
+            self._not_full.notify_all()
+            return items
+
+    def close(self, error: E | None = None) -> None:
+        with self._lock:
+            self._state.close(error)
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def __iter__(self) -> t.Iterator[Ok[T, E] | Err[T, E]]:
+        while True:
+            try:
+                yield self.get()
+            except ChannelClosedError:
+                return
+
+
+class AsyncResultChannel(t.Generic[T, E]):
+    def __init__(self, capacity: int = 0, *, prioritize_errors: bool = False) -> None:
+        self._state: _State[T, E] = _State(capacity, prioritize_errors)
+        # created on first use so the condition binds to the running loop on Python < 3.10
+        self._condition: asyncio.Condition | None = None
+
+    @property
+    def _cond(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    @property
+    def closed(self) -> bool:
+        return self._state.closed
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+    async def _wait(self, predicate: t.Callable[[], bool], timeout: float | None, message: str) -> None:
+        try:
+            await asyncio.wait_for(self._cond.wait_for(predicate), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(message) from None
+
+    async def put(self, item: Ok[T, E] | Err[T, E], timeout: float | None = None) -> None:
+        await self.put_many((item,), timeout)
+
+    async def put_many(self, items: t.Iterable[Ok[T, E] | Err[T, E]], timeout: float | None = None) -> None:
+        pending = list(items)
+        total = len(pending)
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        state = self._state
+        async with self._cond:
+            while pending:
+                needed = state.needed(len(pending), total)
+                if not state.has_room(needed) and not state.closed:
+                    remaining = None if deadline is None else max(deadline - loop.time(), 0)
+                    try:
+                        await self._wait(lambda: state.closed or state.has_room(needed), remaining, "timed out waiting for room in the channel")
+                    except TimeoutError as exc:
+                        raise _interrupted(exc, total - len(pending)) from None
+                if state.closed:
+                    raise _interrupted(ChannelClosedError("send on a closed channel"), total - len(pending))
+                space = state.space()
+                batch = pending if space < 0 else pending[:space]
+                pending = [] if space < 0 else pending[space:]
+                state.push(batch)
+                self._cond.notify_all()
+
+    async def get(self, timeout: float | None = None) -> Ok[T, E] | Err[T, E]:
+        return (await self.get_many(1, timeout))[0]
+
+    async def get_many(self, max_items: int, timeout: float | None = None) -> list[Ok[T, E] | Err[T, E]]:
+        state = self._state
+        async with self._cond:
+            if not state and not state.closed:
+                await self._wait(lambda: bool(state) or state.closed, timeout, "timed out waiting for an item")
+            if not state:
+                return state.take_final()
+            items = state.pop(max_items)
+            self._cond.notify_all()
+            return items
+
+    async def close(self, error: E | None = None) -> None:
+        async with self._cond:
+            self._state.close(error)
+            self._cond.notify_all()
+
+    def __aiter__(self) -> t.AsyncIterator[Ok[T, E] | Err[T, E]]:
+        return self._iterate()
+
+    async def _iterate(self) -> t.AsyncIterator[Ok[T, E] | Err[T, E]]:
+        while True:
+            try:
+                yield await self.get()
+            except ChannelClosedError:
+                return
@@ -0,0 +1,98 @@
+"""Latency budgets for `Result.of` and `Option.of`.
+
+`Result.of(fn, within=...)` and calls made inside `with deadline(...)` run
+`fn` on a shared thread pool and give up waiting once the budget is spent,
+returning `Err(DeadlineExceeded)`. The worker thread cannot be interrupted,
+so `fn` keeps running in the background until it returns.
+
+Deadlines propagate through `contextvars`, so nested `Result.of` calls made
+by `fn` inherit what is left of the caller's budget. A nested call that does
+not tighten the budget runs inline, because the enclosing call is already
+waiting on that same deadline.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import threading
+import time
+import typing as t
+
+from .exceptions import DeadlineExceeded
+
+if t.TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor  # pragma: no cover
+
+T = t.TypeVar("T")
+
+current_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar("optionresult_deadline", default=None)
+# the deadline that an enclosing call is already waiting on in another thread
+_enforced: contextvars.ContextVar[float | None] = contextvars.ContextVar("optionresult_enforced_deadline", default=None)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> t.Iterator[None]:
+    """Bound every `Result.of`/`Option.of` call in this context to `seconds` from now.
+
+    A nested deadline can shorten the enclosing one but never extend it.
+    """
+    at = time.monotonic() + seconds
+    outer = current_deadline.get()
+    if outer is not None and outer < at:
+        at = outer
+    token = current_deadline.set(at)
+    try:
+        yield
+    finally:
+        current_deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Seconds left in the current deadline, or `None` when there is none."""
+    at = current_deadline.get()
+    if at is None:
+        return None
+    return max(at - time.monotonic(), 0.0)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                _executor = ThreadPoolExecutor(thread_name_prefix="optionresult-deadline")
+    return _executor
+
+
+def call(fn: t.Callable[..., T], args: tuple[t.Any, ...], kwargs: dict[str, t.Any], within: float | None) -> T:
+    """Call `fn` within `within` seconds and the current deadline, raising `DeadlineExceeded` when they run out."""
+    at = current_deadline.get()
+    if within is not None:
+        at = time.monotonic() + within if at is None else min(at, time.monotonic() + within)
+    if at is None:
+        return fn(*args, **kwargs)
+    budget = at - time.monotonic()
+    if budget <= 0:
+        raise DeadlineExceeded(f"deadline exceeded before calling {getattr(fn, '__qualname__', fn)!r}")
+    enforced = _enforced.get()
+    if enforced is not None and enforced <= at:
+        return fn(*args, **kwargs)
+
+    context = contextvars.copy_context()
+    context.run(current_deadline.set, at)
+    context.run(_enforced.set, at)
+    future = _get_executor().submit(context.run, fn, *args, **kwargs)
+    from concurrent.futures import TimeoutError as FutureTimeoutError
+
+    try:
+        return future.result(budget)
+    except FutureTimeoutError:
+        future.cancel()
+        raise DeadlineExceeded(f"{getattr(fn, '__qualname__', fn)!r} did not finish within {budget:.3f}s") from None
@@ -1 +1,92 @@
-class PanicError(ValueError): ...
+from __future__ import annotations
+
+import typing as t
+
+if t.TYPE_CHECKING:
+    from .provenance import Trail  # pragma: no cover
+    from .schema import FieldError  # pragma: no cover
+
+
+class PanicError(ValueError):
+    def __init__(self, *args: object, trail: Trail | None = None) -> None:
+        super().__init__(*args)
+        self.trail = trail
+
+    def __str__(self) -> str:
+        message = super().__str__()
+        if self.trail is None:
+            return message
+        return f"{message}\n{self.trail.format()}"
+
+
+class SchemaError(ValueError):
+    def __init__(self, errors: list[FieldError]) -> None:
+        super().__init__(errors)
+        self.errors = errors
+
+    def prefixed(self, key: str | int) -> SchemaError:
+        return SchemaError([error._replace(path=(key, *error.path)) for error in self.errors])
+
+    def __str__(self) -> str:
+        return "; ".join(map(str, self.errors))
+
+
+class ContextError(Exception):
+    """An error wrapped with a context message that is only formatted when shown.
+
+    `context` is either a format string applied to `args` or a zero-argument
+    callable returning the message; `source` is the wrapped error, which may
+    itself be a `ContextError`.
+    """
+
+    def __init__(self, context: str | t.Callable[[], str], source: object, args: tuple[object, ...] = ()) -> None:
+        super().__init__(context, source)
+        self.context = context
+        self.source = source
+        self.format_args = args
+        self._message: str | None = None
+        if isinstance(source, BaseException):
+            self.__cause__ = source
+
+    @property
+    def message(self) -> str:
+        message = self._message
+        if message is None:
+            if callable(self.context):
+                message = self.context()
+            elif self.format_args:
+                message = self.context.format(*self.format_args)
+            else:
+                message = self.context
+            self._message = message
+        return message
+
+    def chain(self) -> t.Iterator[object]:
+        """Yield this error, every wrapped `ContextError` and finally the root cause."""
+        error: object = self
+        while isinstance(error, ContextError):
+            yield error
+            error = error.source
+        yield error
+
+    @property
+    def root_cause(self) -> object:
+        error: object = self
+        while isinstance(error, ContextError):
+            error = error.source
+        return error
+
+    def __str__(self) -> str:
+        return ": ".join(error.message if isinstance(error, ContextError) else str(error) for error in self.chain())
+
+    def __repr__(self) -> str:
+        return f"ContextError({self.message!r}, {self.source!r})"
+
+
+class ChannelClosedError(Exception): ...
+
+
+class DeadlineExceeded(TimeoutError): ...
+
+
+class ReplayMissError(LookupError): ...
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import collections
+import os
+import typing as t
+
+from .exceptions import ContextError
+from .option import Option
+
+if t.TYPE_CHECKING:
+    from .result import Err, Ok, Result  # pragma: no cover
+
+
+class Fingerprint(t.NamedTuple):
+    kind: str
+    args: t.Tuple[t.Hashable, ...]
+    site: t.Optional[t.Tuple[str, int]]
+
+    def without_site(self) -> Fingerprint:
+        if self.site is None:
+            return self
+        return self._replace(site=None)
+
+
+def _qualname(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _normalize(value: object) -> t.Hashable:
+    if value is None or isinstance(value, (str, bytes, int, float)):
+        return value
+    if isinstance(value, (tuple, list)):
+        return tuple(_normalize(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_normalize(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted(((repr(k), _normalize(v)) for k, v in value.items()), key=repr))
+    if type(value).__eq__ is object.__eq__:
+        # identity-compared objects would never group, so only keep their type
+        return f"<{_qualname(type(value))}>"
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return t.cast(t.Hashable, value)
+
+
+# frames in these directories are plumbing between the caller and the failing code
+_INTERNAL_DIRS = (
+    os.path.dirname(os.path.abspath(__file__)) + os.sep,
+    os.path.join(os.path.dirname(os.path.abspath(os.__file__)), "concurrent", "futures") + os.sep,
+)
+
+
+def _is_internal(filename: str) -> bool:
+    return filename.startswith(_INTERNAL_DIRS)
+
+
+def _raise_site(exc: BaseException) -> tuple[str, int] | None:
+    tb = exc.__traceback__
+    if tb is None:
+        return None
+    caller = tb.tb_frame.f_back
+    site = None
+    while tb is not None:
+        if not _is_internal(tb.tb_frame.f_code.co_filename):
+            site = (tb.tb_frame.f_code.co_filename, tb.tb_lineno)
+        tb = tb.tb_next
+    if site is None:
+        # a builtin raised straight into the package, e.g. `Result.of(int, "x")`,
+        # so fall back to the line the nearest outside caller is on now
+        while caller is not None and _is_internal(caller.f_code.co_filename):
+            caller = caller.f_back
+        if caller is not None:
+            site = (caller.f_code.co_filename, caller.f_lineno)
+    return site
+
+
+def _context_key(error: ContextError) -> str:
+    context = error.context
+    if isinstance(context, str):
+        return context
+    return f"{getattr(context, '__module__', None)}.{getattr(context, '__qualname__', _qualname(type(context)))}"
+
+
+def fingerprint(error: object) -> Fingerprint:
+    """Compute a hashable fingerprint of an error value.
+
+    Exceptions are keyed by their type, normalized args and, when they have
+    been raised, the file and line of the innermost traceback frame outside
+    this package. An exception raised by a builtin that the package called
+    has no such frame, so it is keyed to the line its caller is running when
+    the fingerprint is first computed: the call itself when the `Err` is
+    fingerprinted or indexed where it was made. Other values are keyed by
+    their type and normalized value.
+
+    A `ContextError` is keyed by its root cause's fingerprint and the
+    unformatted context of each layer, so one template wrapping different
+    failures does not group them together.
+    """
+    if isinstance(error, ContextError):
+        root = fingerprint(error.root_cause)
+        contexts = tuple(_context_key(layer) for layer in error.chain() if isinstance(layer, ContextError))
+        return Fingerprint(_qualname(ContextError), (root.kind, root.args, contexts), root.site)
+    if isinstance(error, BaseException):
+        return Fingerprint(_qualname(type(error)), _normalize(error.args), _raise_site(error))  # type: ignore[arg-type]
+    return Fingerprint(_qualname(type(error)), (_normalize(error),), None)
+
+
+class ErrorGroup:
+    __slots__ = ("fingerprint", "count", "first", "last", "exemplars")
+
+    def __init__(self, fingerprint: Fingerprint, err: Err, exemplars: int) -> None:
+        self.fingerprint = fingerprint
+        self.count = 1
+        self.first = err
+        self.last = err
+        self.exemplars: t.Deque[Err] = collections.deque((err,), maxlen=exemplars)
+
+    def add(self, err: Err) -> None:
+        self.count += 1
+        self.last = err
+        self.exemplars.append(err)
+
+    def __repr__(self) -> str:
+        return f"ErrorGroup({self.fingerprint!r}, count={self.count})"
+
+
+class ErrorIndex:
+    """Group a stream of `Err` values by fingerprint.
+
+    Each group keeps a count, the first and last `Err` and up to `exemplars`
+    of the most recent ones, so memory stays bounded by the number of
+    distinct fingerprints. `Ok` values are ignored. With `site=False` errors
+    raised from different places are grouped together. An index is not
+    thread-safe; give each worker its own or guard it with a lock.
+    """
+
+    def __init__(self, *, exemplars: int = 5, site: bool = True) -> None:
+        self.exemplars = exemplars
+        self.site = site
+        self.total = 0
+        self._groups: t.Dict[Fingerprint, ErrorGroup] = {}
+
+    def add(self, result: Ok | Err | Result) -> Option[ErrorGroup]:
+        from .lazy import LazyResult
+        from .result import Err
+
+        if isinstance(result, LazyResult):
+            result = result.force()
+        if not isinstance(result, Err):
+            return Option(None)
+        key = result.fingerprint()
+        if not self.site:
+            key = key.without_site()
+        self.total += 1
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = ErrorGroup(key, result, self.exemplars)
+        else:
+            group.add(result)
+        return Option(group)
+
+    def extend(self, results: t.Iterable[Ok | Err | Result]) -> None:
+        for result in results:
+            self.add(result)
+
+    def get(self, key: Fingerprint) -> Option[ErrorGroup]:
+        if not self.site:
+            key = key.without_site()
+        return Option(self._groups.get(key))
+
+    def most_common(self, n: int | None = None) -> list[ErrorGroup]:
+        groups = sorted(self._groups.values(), key=lambda group: group.count, reverse=True)
+        return groups if n is None else groups[:n]
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def __iter__(self) -> t.Iterator[ErrorGroup]:
+        return iter(self._groups.values())
+
+    def __repr__(self) -> str:
+        return f"ErrorIndex(groups={len(self._groups)}, total={self.total})"
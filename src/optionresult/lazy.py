@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import threading
+import typing as t
+
+from .exceptions import ContextError
+from .option import Option
+from .result import Result
+
+if t.TYPE_CHECKING:
+    from .result import Err, Ok  # pragma: no cover
+
+T = t.TypeVar("T")
+U = t.TypeVar("U")
+E = t.TypeVar("E")
+F = t.TypeVar("F")
+N = t.TypeVar("N", bound="Result[t.Any, t.Any]")
+
+
+class Slot(t.Generic[T]):
+    """A thread-safe cell that is either empty or holds a value.
+
+    `get_or_insert_with` runs its initializer at most once, even when many
+    threads race on an empty slot, which makes slots a cheap way to declare
+    lazily initialized fields.
+    """
+
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self, value: T | None = None) -> None:
+        self._value = value
+        self._lock = threading.Lock()
+
+    def get(self) -> Option[T]:
+        return Option(self._value)
+
+    def is_some(self) -> bool:
+        return self._value is not None
+
+    def is_none(self) -> bool:
+        return self._value is None
+
+    def insert(self, value: T) -> T:
+        with self._lock:
+            self._value = value
+        return value
+
+    def take(self) -> Option[T]:
+        with self._lock:
+            value, self._value = self._value, None
+        return Option(value)
+
+    def replace(self, value: T) -> Option[T]:
+        with self._lock:
+            old, self._value = self._value, value
+        return Option(old)
+
+    def get_or_insert_with(self, f: t.Callable[[], T]) -> T:
+        value = self._value
+        if value is None:
+            with self._lock:
+                value = self._value
+                if value is None:
+                    value = f()
+                    if value is None:
+                        raise ValueError("`Slot.get_or_insert_with()` initializer returned `None`")
+                    self._value = value
+        return value
+
+    def __repr__(self) -> str:
+        if self._value is None:
+            return "Slot(<empty>)"
+        return f"Slot({self._value!r})"
+
+
+class LazyOption(Option[T]):
+    """An `Option` whose value is computed on first access and then memoized.
+
+    Created by `Option.lazy`. If the computation raises, the exception
+    propagates and the next access retries it.
+    """
+
+    __slots__ = ("_fn", "_args", "_kwargs", "_slot")
+
+    def __init__(self, fn: t.Callable[..., T | None], *args: t.Any, **kwargs: t.Any) -> None:
+        object.__setattr__(self, "_fn", fn)
+        object.__setattr__(self, "_args", args)
+        object.__setattr__(self, "_kwargs", kwargs)
+        object.__setattr__(self, "_slot", Slot())
+
+    def _evaluate(self) -> Option[T]:
+        option = Option(self._fn(*self._args, **self._kwargs))
+        # only reached under the slot lock, so nothing else observes the release
+        object.__setattr__(self, "_fn", None)
+        object.__setattr__(self, "_args", None)
+        object.__setattr__(self, "_kwargs", None)
+        return option
+
+    def force(self) -> Option[T]:
+        return self._slot.get_or_insert_with(self._evaluate)
+
+    def is_evaluated(self) -> bool:
+        return self._slot.is_some()
+
+    @property
+    def value(self) -> T | None:  # type: ignore[override]
+        return self.force().value
+
+    def __repr__(self) -> str:
+        forced = self._slot.get()
+        if forced.is_none():
+            return f"Option.lazy({self._fn!r})"
+        return repr(forced.unwrap())
+
+
+class LazyResult(Result[T, E]):
+    """A `Result` whose outcome is computed on first access and then memoized.
+
+    Created by `Result.lazy`. Every method forces the computation and
+    delegates to the resulting `Ok` or `Err`; use `force()` to get that
+    instance for `isinstance` checks or pattern matching.
+    """
+
+    __slots__ = ("_fn", "_slot")
+
+    def __init__(self, fn: t.Callable[[], Ok[T, E] | Err[T, E]]) -> None:
+        object.__setattr__(self, "_fn", fn)
+        object.__setattr__(self, "_slot", Slot())
+
+    def _evaluate(self) -> Ok[T, E] | Err[T, E]:
+        result = self._fn()
+        object.__setattr__(self, "_fn", None)
+        return result
+
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        return self.force().__reduce__()
+
+    def force(self) -> Ok[T, E] | Err[T, E]:
+        return self._slot.get_or_insert_with(self._evaluate)
+
+    def is_evaluated(self) -> bool:
+        return self._slot.is_some()
+
+    @property
+    def value(self) -> T | E:
+        return self.force().value
+
+    def is_ok(self) -> bool:
+        return self.force().is_ok()
+
+    def is_ok_and(self, f: t.Callable[[T], bool]) -> bool:
+        return self.force().is_ok_and(f)
+
+    def is_err(self) -> bool:
+        return self.force().is_err()
+
+    def is_err_and(self, f: t.Callable[[E], bool]) -> bool:
+        return self.force().is_err_and(f)
+
+    def ok(self) -> Option[T]:
+        return self.force().ok()
+
+    def err(self) -> Option[E]:
+        return self.force().err()
+
+    def map(self, f: t.Callable[[T], U]) -> Ok[U, E] | Err[T, E]:
+        return self.force().map(f)
+
+    def map_or(self, default: U, f: t.Callable[[T], U]) -> U:
+        return self.force().map_or(default, f)
+
+    def map_or_else(self, default: t.Callable[[E], U], f: t.Callable[[T], U]) -> U:
+        return self.force().map_or_else(default, f)
+
+    def map_err(self, op: t.Callable[[E], F]) -> Ok[T, E] | Err[T, F]:
+        return self.force().map_err(op)
+
+    def inspect(self, f: t.Callable[[T], None]) -> Ok[T, E] | Err[T, E]:
+        return self.force().inspect(f)
+
+    def inspect_err(self, f: t.Callable[[E], None]) -> Ok[T, E] | Err[T, E]:
+        return self.force().inspect_err(f)
+
+    def expect(self, msg: str) -> T:
+        return self.force().expect(msg)
+
+    def unwrap(self) -> T:
+        return self.force().unwrap()
+
+    def expect_err(self, msg: str) -> E:
+        return self.force().expect_err(msg)
+
+    def unwrap_err(self) -> E:
+        return self.force().unwrap_err()
+
+    def and_(self, resb: Ok[U, F] | Err[U, F] | Result[U, F]) -> Ok[U, F] | Err[U, F] | Result[U, F]:
+        return self.force().and_(resb)  # type: ignore[return-value]
+
+    def __and__(self, resb: Ok[U, F] | Err[U, F] | Result[U, F]) -> Ok[U, F] | Err[U, F] | Result[U, F]:
+        return self.and_(resb)
+
+    def and_then(self, f: t.Callable[[T], Ok | Err | Result]) -> Ok | Err | Result:
+        return self.force().and_then(f)
+
+    def or_(self, res: Ok | Err | Result) -> Ok | Err | Result:
+        return self.force().or_(res)
+
+    def __or__(self, res: Ok | Err | Result) -> Ok | Err | Result:
+        return self.or_(res)
+
+    def or_else(self, op: t.Callable[[E], Ok | Err | Result]) -> Ok | Err | Result:
+        return self.force().or_else(op)
+
+    def unwrap_or(self, default: T) -> T:
+        return self.force().unwrap_or(default)
+
+    def unwrap_or_else(self, f: t.Callable[[E], T]) -> T:
+        return self.force().unwrap_or_else(f)
+
+    def flatten(self: LazyResult[N, E]) -> N | Err[N, E]:
+        return self.force().flatten()
+
+    def transpose(self: LazyResult[Option[U], E]) -> Option[Ok[U, E] | Err[Option[U], E]]:
+        return self.force().transpose()
+
+    def iter(self) -> t.Iterator[T]:
+        return self.force().iter()
+
+    def context(self, msg: str, *args: object) -> Ok[T, E] | Err[T, ContextError]:
+        return self.force().context(msg, *args)
+
+    def with_context(self, f: t.Callable[[], str]) -> Ok[T, E] | Err[T, ContextError]:
+        return self.force().with_context(f)
+
+    def __eq__(self, other: object) -> bool:
+        return self.force() == other
+
+    def __repr__(self) -> str:
+        forced = self._slot.get()
+        if forced.is_none():
+            return f"Result.lazy({self._fn!r})"
+        return repr(forced.unwrap())
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import typing as t
 
-from .exceptions import PanicError
+from . import deadline
+from .exceptions import DeadlineExceeded, PanicError
 
 if t.TYPE_CHECKING:
-    from .result import Err, Ok  # pragma: no cover
+    from .lazy import LazyOption  # pragma: no cover
+    from .result import Err, Ok, Result  # pragma: no cover
 
 T = t.TypeVar("T")
 U = t.TypeVar("U")
@@ -15,20 +17,43 @@ F = t.TypeVar("F")
 
 
 class Option(t.Generic[T]):
+    __slots__ = ("value", "__weakref__")
+
     @staticmethod
     def of(
         fn: t.Callable[..., U],
         *args: t.Any,
         catch: t.Type[Exception] = Exception,
+        within: float | None = None,
         **kwargs: t.Any,
     ) -> Option[U]:
+        if within is None and deadline.current_deadline.get() is None:
+            try:
+                return Option(fn(*args, **kwargs))
+            except catch:
+                return _NONE
         try:
-            return Option(fn(*args, **kwargs))
-        except catch:
-            return Option(None)
+            return Option(deadline.call(fn, args, kwargs, within))
+        except (DeadlineExceeded, catch):
+            return _NONE
+
+    @staticmethod
+    def lazy(fn: t.Callable[..., U | None], *args: t.Any, **kwargs: t.Any) -> LazyOption[U]:
+        from .lazy import LazyOption
+
+        return LazyOption(fn, *args, **kwargs)
+
+    def __init__(self, value: T | None) -> None:
+        _set_value(self, value)
+
+    def __setattr__(self, name: str, value: t.Any) -> t.NoReturn:
+        raise AttributeError(f"`{type(self).__name__}` is immutable")
 
-    def __init__(self, value: T | None):
-        self.value = value
+    def __delattr__(self, name: str) -> t.NoReturn:
+        raise AttributeError(f"`{type(self).__name__}` is immutable")
+
+    def __reduce__(self) -> tuple[type[Option], tuple[T | None]]:
+        return (Option, (self.value,))
 
     def is_some(self) -> bool:
         return self.value is not None
@@ -65,7 +90,7 @@ class Option(t.Generic[T]):
 
     def map(self, f: t.Callable[[T], U | None]) -> Option[U]:
         if self.value is None:
-            return Option(None)
+            return _NONE
         else:
             return Option(f(self.value))
 
@@ -104,7 +129,7 @@ class Option(t.Generic[T]):
 
     def and_(self, optb: Option[U]) -> Option[U]:
         if self.value is None:
-            return Option(None)
+            return _NONE
         else:
             return optb
 
@@ -113,17 +138,17 @@ class Option(t.Generic[T]):
 
     def and_then(self, f: t.Callable[[T], Option[U]]) -> Option[U]:
         if self.value is None:
-            return Option(None)
+            return _NONE
         else:
             return f(self.value)
 
     def filter(self, predicate: t.Callable[[T], bool]) -> Option[T]:
         if self.value is None:
-            return Option(None)
+            return _NONE
         if predicate(self.value):
-            return Option(self.value)
+            return self
         else:
-            return Option(None)
+            return _NONE
 
     def or_(self, optb: Option[T]) -> Option[T]:
         if self.value is None:
@@ -145,11 +170,48 @@ class Option(t.Generic[T]):
             return optb
         if self.value is not None and optb.value is None:
             return self
-        return Option(None)
+        return _NONE
 
     def __xor__(self, optb: Option[T]) -> Option[T]:
         return self.xor(optb)
 
+    def zip(self, other: Option[U]) -> Option[tuple[T, U]]:
+        if self.value is None or other.value is None:
+            return _NONE
+        return Option((self.value, other.value))
+
+    def unzip(self: Option[tuple[U, R]]) -> tuple[Option[U], Option[R]]:
+        if self.value is None:
+            return _NONE_PAIR
+        a, b = self.value
+        return (Option(a), Option(b))
+
+    def flatten(self: Option[Option[U]]) -> Option[U]:
+        if self.value is None:
+            return _NONE
+        return self.value
+
+    @t.overload
+    def transpose(self: Option[Ok[U, E]]) -> Ok[Option[U], E]: ...
+    @t.overload
+    def transpose(self: Option[Err[U, E]]) -> Err[Option[U], E]: ...
+    @t.overload
+    def transpose(self: Option[Ok[U, E] | Err[U, E] | Result[U, E]]) -> Ok[Option[U], E] | Err[Option[U], E]: ...
+
+    def transpose(self: Option[t.Any]) -> Ok[Option[t.Any], t.Any] | Err[Option[t.Any], t.Any]:
+        from .result import Ok
+
+        if self.value is None:
+            return Ok(_NONE)
+        if self.value.is_err():
+            return self.value  # type: ignore[return-value]
+        return Ok(Option(self.value.value))
+
+    def iter(self) -> t.Iterator[T]:
+        if self.value is None:
+            return iter(())
+        return iter((self.value,))
+
     def __eq__(self, value: object) -> bool:
         if isinstance(value, Option):
             return self.value == value.value
@@ -159,3 +221,10 @@ class Option(t.Generic[T]):
         if self.value is None:
             return "None"
         return f"Some({self.value!r})"
+
+
+# bound once: cheaper per construction than `object.__setattr__` on an immutable type
+_set_value = Option.__dict__["value"].__set__
+# returned by combinators that produce nothing, so they don't allocate
+_NONE: Option[t.Any] = Option(None)
+_NONE_PAIR: tuple[Option[t.Any], Option[t.Any]] = (_NONE, _NONE)
@@ -0,0 +1,234 @@
+"""Opt-in tracing of where `Err` values come from.
+
+While tracing is enabled every new `Err` records the call site that created
+it, and every combinator called on it appends a step to a fixed-size ring
+buffer. `PanicError` raised by `Err.unwrap` or `Err.expect` carries that
+trail. On Python 3.12+ the hooks use `sys.monitoring` local events; older
+interpreters swap in wrapped methods on `Err`. Either way nothing is
+installed while tracing is disabled, so the normal code paths run unchanged.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import functools
+import os
+import sys
+import threading
+import typing as t
+from types import CodeType, FrameType
+
+from .option import Option
+from .result import Err
+
+if t.TYPE_CHECKING:
+    from .result import Ok, Result  # pragma: no cover
+
+DEFAULT_SIZE = 16
+STEPS = (
+    "map",
+    "map_or",
+    "map_or_else",
+    "map_err",
+    "inspect",
+    "inspect_err",
+    "and_",
+    "and_then",
+    "or_",
+    "or_else",
+    "unwrap_or",
+    "unwrap_or_else",
+    "flatten",
+    "context",
+    "with_context",
+    "ok",
+    "err",
+    "expect",
+    "unwrap",
+)
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+_TYPING_FILE = t.__file__
+
+
+class Site(t.NamedTuple):
+    filename: str
+    lineno: int
+    function: str
+
+    def __str__(self) -> str:
+        return f"{self.filename}:{self.lineno} in {self.function}"
+
+
+class Trail:
+    """The creation site of an `Err` and the most recent steps it passed through."""
+
+    __slots__ = ("origin", "steps")
+
+    def __init__(self, origin: Site | None, size: int, steps: t.Iterable[tuple[str, Site | None]] = ()) -> None:
+        self.origin = origin
+        self.steps: t.Deque[tuple[str, Site | None]] = collections.deque(steps, maxlen=size)
+
+    def format(self) -> str:
+        lines = [f"Err created at {self.origin or '<unknown>'}"]
+        lines.extend(f"  .{name}() at {site or '<unknown>'}" for name, site in self.steps)
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"Trail({self.origin!r}, steps={len(self.steps)})"
+
+
+def _user_frame(frame: FrameType | None) -> FrameType | None:
+    while frame is not None and (frame.f_code.co_filename.startswith(_PACKAGE_DIR) or frame.f_code.co_filename == _TYPING_FILE):
+        frame = frame.f_back
+    return frame
+
+
+def _site(frame: FrameType | None) -> Site | None:
+    frame = _user_frame(frame)
+    if frame is None:
+        return None
+    return Site(frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name)
+
+
+class _Tracer:
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.init = Err.__dict__["__init__"]
+        self.methods = {name: Err.__dict__[name] for name in STEPS}
+        self.step_codes = {method.__code__: name for name, method in self.methods.items()}
+
+    def on_create(self, err: Err, caller: FrameType | None) -> None:
+        # an Err made by an Err combinator (e.g. `map_err`) continues its parent's trail
+        parent = None
+        frame = caller
+        while frame is not None and frame.f_code.co_filename == _TYPING_FILE:
+            frame = frame.f_back
+        if frame is not None and frame.f_code in self.step_codes:
+            parent = getattr(frame.f_locals.get("self"), "_trail", None)
+        if parent is not None:
+            trail = Trail(parent.origin, self.size, parent.steps)
+        else:
+            trail = Trail(_site(caller), self.size)
+        object.__setattr__(err, "_trail", trail)
+
+    def on_step(self, err: Err, name: str, caller: FrameType | None) -> None:
+        trail = getattr(err, "_trail", None)
+        if trail is None:
+            trail = Trail(None, self.size)
+            object.__setattr__(err, "_trail", trail)
+        trail.steps.append((name, _site(caller)))
+
+    def install(self) -> None:
+        raise NotImplementedError
+
+    def uninstall(self) -> None:
+        raise NotImplementedError
+
+
+class _PatchTracer(_Tracer):
+    """Fallback that temporarily replaces `Err` methods with recording wrappers."""
+
+    def install(self) -> None:
+        init = self.init
+
+        @functools.wraps(init)
+        def __init__(err: Err, value: t.Any) -> None:
+            init(err, value)
+            self.on_create(err, sys._getframe(1))
+
+        setattr(Err, "__init__", __init__)
+        for name, method in self.methods.items():
+            setattr(Err, name, self._wrap(name, method))
+
+    def _wrap(self, name: str, method: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
+        @functools.wraps(method)
+        def step(err: Err, *args: t.Any, **kwargs: t.Any) -> t.Any:
+            self.on_step(err, name, sys._getframe(1))
+            return method(err, *args, **kwargs)
+
+        return step
+
+    def uninstall(self) -> None:
+        setattr(Err, "__init__", self.init)
+        for name, method in self.methods.items():
+            setattr(Err, name, method)
+
+
+class _MonitoringTracer(_Tracer):
+    """Python 3.12+ tracer driven by `sys.monitoring` local `PY_START` events."""
+
+    def install(self) -> None:
+        monitoring = sys.monitoring  # type: ignore[attr-defined]
+        free = [tool for tool in range(6) if monitoring.get_tool(tool) is None]
+        if not free:
+            raise RuntimeError("no free `sys.monitoring` tool id")
+        self.tool = free[-1]
+        monitoring.use_tool_id(self.tool, "optionresult.provenance")
+        monitoring.register_callback(self.tool, monitoring.events.PY_START, self._on_start)
+        for code in (self.init.__code__, *self.step_codes):
+            monitoring.set_local_events(self.tool, code, monitoring.events.PY_START)
+
+    def _on_start(self, code: CodeType, offset: int) -> None:
+        frame = sys._getframe(1)
+        err = frame.f_locals["self"]
+        if code is self.init.__code__:
+            self.on_create(err, frame.f_back)
+        else:
+            self.on_step(err, self.step_codes[code], frame.f_back)
+
+    def uninstall(self) -> None:
+        monitoring = sys.monitoring  # type: ignore[attr-defined]
+        for code in (self.init.__code__, *self.step_codes):
+            monitoring.set_local_events(self.tool, code, 0)
+        monitoring.register_callback(self.tool, monitoring.events.PY_START, None)
+        monitoring.free_tool_id(self.tool)
+
+
+_lock = threading.Lock()
+_tracer: _Tracer | None = None
+
+
+def is_enabled() -> bool:
+    return _tracer is not None
+
+
+def enable(size: int = DEFAULT_SIZE, *, monitoring: bool | None = None) -> None:
+    """Start recording `Err` provenance, keeping at most `size` steps per `Err`.
+
+    `monitoring` selects the `sys.monitoring` backend; by default it is used
+    whenever the interpreter provides it.
+    """
+    global _tracer
+
+    if monitoring is None:
+        monitoring = hasattr(sys, "monitoring")
+    with _lock:
+        if _tracer is not None:
+            raise RuntimeError("provenance tracing is already enabled")
+        tracer = _MonitoringTracer(size) if monitoring else _PatchTracer(size)
+        tracer.install()
+        _tracer = tracer
+
+
+def disable() -> None:
+    global _tracer
+
+    with _lock:
+        if _tracer is not None:
+            _tracer.uninstall()
+            _tracer = None
+
+
+@contextlib.contextmanager
+def tracing(size: int = DEFAULT_SIZE, *, monitoring: bool | None = None) -> t.Iterator[None]:
+    enable(size, monitoring=monitoring)
+    try:
+        yield
+    finally:
+        disable()
+
+
+def trail(result: Ok | Err | Result) -> Option[Trail]:
+    return Option(getattr(result, "_trail", None))
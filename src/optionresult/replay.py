@@ -0,0 +1,273 @@
+"""Record the outcomes of `Result.of` calls and replay them offline.
+
+While a `Recorder` is active every `Result.of` call runs normally and its
+key, outcome and latency are appended to a file. While a `Replayer` is
+active `Result.of` never calls `fn`: it serves the outcomes recorded under
+the same key, in recorded order, cycling when they run out, and optionally
+sleeps for the recorded latency. A key with no recording returns
+`Err(ReplayMissError)`.
+
+Keys hash the function's qualified name and the `repr` of its arguments, so
+arguments must have a stable `repr`; pass `key=` to use something else.
+Values use the `shm` encoding, which pickles anything that is not a
+primitive. Recording never changes what `Result.of` returns: a value that
+cannot be pickled is stored as a marker, and it replays as
+`Err(ReplayMissError)`, as does a stored value that fails to unpickle. The
+file is laid out as::
+
+    header   magic
+    values   payloads in call order
+    index    one entry per call sorted by key: key hash, tag, latency, offset, length
+    trailer  index offset, count, magic
+
+Like `provenance`, both modes swap `Result.of` while active and restore it
+afterwards, so only code that looks up `Result.of` at call time is affected.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+import typing as t
+
+from . import deadline
+from .exceptions import DeadlineExceeded, ReplayMissError
+from .option import Option
+from .result import Err, Ok, Result
+from .shm import _ERR, _decode, _encode
+
+# tag flag for an outcome that could not be encoded; the payload is the reason
+_UNRECORDABLE = 0x40
+
+MAGIC = b"ORRPL\x00\x00\x01"
+_KEY_SIZE = 16
+_ENTRY = struct.Struct(f"<{_KEY_SIZE}sBdQQ")
+_TRAILER = struct.Struct("<QQ8s")
+
+KeyFunc = t.Callable[[t.Callable[..., t.Any], t.Tuple[t.Any, ...], t.Dict[str, t.Any]], str]
+
+
+def call_key(fn: t.Callable[..., t.Any], args: tuple[t.Any, ...], kwargs: dict[str, t.Any]) -> str:
+    name = f"{getattr(fn, '__module__', None)}.{getattr(fn, '__qualname__', repr(fn))}"
+    if kwargs:
+        return f"{name}{args!r}{sorted(kwargs.items())!r}"
+    return f"{name}{args!r}"
+
+
+def _digest(key: str) -> bytes:
+    return hashlib.blake2b(key.encode("utf-8", "surrogatepass"), digest_size=_KEY_SIZE).digest()
+
+
+_lock = threading.Lock()
+_active: Recorder | Replayer | None = None
+
+
+def _install(interceptor: Recorder | Replayer) -> staticmethod:
+    global _active
+
+    with _lock:
+        if _active is not None:
+            raise RuntimeError("a recording or replay is already active")
+        original = Result.__dict__["of"]
+        setattr(Result, "of", staticmethod(interceptor))
+        _active = interceptor
+        return original  # type: ignore[no-any-return]
+
+
+def _uninstall(interceptor: Recorder | Replayer, original: staticmethod) -> None:
+    global _active
+
+    with _lock:
+        if _active is interceptor:
+            setattr(Result, "of", original)
+            _active = None
+
+
+class Recorder:
+    """Append every `Result.of` outcome to `path` while used as a context manager."""
+
+    def __init__(self, path: str | os.PathLike[str], *, key: KeyFunc = call_key) -> None:
+        self._key = key
+        self._lock = threading.Lock()
+        self._entries: list[tuple[bytes, int, float, int, int]] = []
+        self._file: t.BinaryIO | None = open(path, "wb")
+        self._file.write(MAGIC)
+        self._offset = len(MAGIC)
+        self._original: staticmethod | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record(self, key: str, result: Ok[t.Any, t.Any] | Err[t.Any, t.Any], latency: float) -> None:
+        try:
+            kind, payload = _encode(result.value)
+        except Exception as exc:  # anything pickle can raise for an arbitrary value
+            kind, payload = _UNRECORDABLE, f"{type(result.value).__qualname__} could not be recorded: {exc}".encode("utf-8", "backslashreplace")
+        tag = kind | (_ERR if result.is_err() else 0)
+        digest = _digest(key)
+        with self._lock:
+            if self._file is None:
+                raise ValueError("record on a closed Recorder")
+            self._file.write(payload)
+            self._entries.append((digest, tag, latency, self._offset, len(payload)))
+            self._offset += len(payload)
+
+    def __call__(
+        self,
+        fn: t.Callable[..., t.Any],
+        *args: t.Any,
+        catch: t.Type[Exception] = Exception,
+        within: float | None = None,
+        **kwargs: t.Any,
+    ) -> Ok[t.Any, t.Any] | Err[t.Any, t.Any]:
+        assert self._original is not None
+        start = time.perf_counter()
+        result = self._original.__func__(fn, *args, catch=catch, within=within, **kwargs)
+        latency = time.perf_counter() - start
+        try:
+            key = self._key(fn, args, kwargs)
+        except Exception:
+            # a call without a key could never be replayed, so it is not recorded
+            return result
+        self.record(key, result, latency)
+        return result
+
+    def close(self) -> None:
+        """Write the index and close the file; further records raise `ValueError`."""
+        with self._lock:
+            if self._file is None:
+                return
+            # a stable sort keeps the recorded order among calls with the same key
+            self._entries.sort(key=lambda entry: entry[0])
+            index = self._offset
+            self._file.write(b"".join(_ENTRY.pack(*entry) for entry in self._entries))
+            self._file.write(_TRAILER.pack(index, len(self._entries), MAGIC))
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> Recorder:
+        self._original = _install(self)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._original is not None:
+            _uninstall(self, self._original)
+        self.close()
+
+
+class _Keys(t.Sequence[bytes]):
+    """The key column of the on-disk index, for bisecting without loading it."""
+
+    def __init__(self, buf: mmap.mmap, offset: int, count: int) -> None:
+        self._buf = buf
+        self._offset = offset
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> bytes:  # type: ignore[override]
+        start = self._offset + index * _ENTRY.size
+        return self._buf[start : start + _KEY_SIZE]
+
+
+class Replayer:
+    """Serve `Result.of` calls from a recording while used as a context manager.
+
+    `latency_scale` multiplies the recorded latency slept before returning;
+    0 disables latency simulation. Simulated calls still honour `within=`
+    and the current `deadline`.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, latency_scale: float = 0.0, key: KeyFunc = call_key) -> None:
+        self.latency_scale = latency_scale
+        self._key = key
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < len(MAGIC) + _TRAILER.size:
+                raise ValueError(f"{os.fspath(path)!r} is not a replay recording")
+            self._buf: mmap.mmap | None = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        index, count, magic = _TRAILER.unpack_from(self._buf, size - _TRAILER.size)
+        if self._buf[: len(MAGIC)] != MAGIC or magic != MAGIC or index + count * _ENTRY.size != size - _TRAILER.size:
+            self.close()
+            raise ValueError(f"{os.fspath(path)!r} is not a replay recording")
+        self._index = index
+        self._keys = _Keys(self._buf, index, count)
+        self._lock = threading.Lock()
+        self._cursors: dict[bytes, int] = {}
+        self._original: staticmethod | None = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def next(self, key: str) -> Option[tuple[Ok[t.Any, t.Any] | Err[t.Any, t.Any], float]]:
+        """Return the next recorded outcome and its latency for `key`, if it was recorded."""
+        if self._buf is None:
+            raise ValueError("operation on closed Replayer")
+        digest = _digest(key)
+        lo = bisect.bisect_left(self._keys, digest)
+        hi = bisect.bisect_right(self._keys, digest, lo)
+        if lo == hi:
+            return Option(None)
+        with self._lock:
+            served = self._cursors.get(digest, 0)
+            self._cursors[digest] = served + 1
+        _, tag, latency, offset, length = _ENTRY.unpack_from(self._buf, self._index + (lo + served % (hi - lo)) * _ENTRY.size)
+        if tag & _UNRECORDABLE:
+            reason = str(self._buf[offset : offset + length], "utf-8")
+            return Option((Err(ReplayMissError(f"outcome for {key} was not recorded: {reason}")), latency))
+        try:
+            result = _decode(tag, self._buf, offset, offset + length)
+        except Exception as exc:
+            miss = ReplayMissError(f"outcome for {key} could not be decoded: {exc}")
+            miss.__cause__ = exc
+            result = Err(miss)
+        return Option((result, latency))
+
+    def __call__(
+        self,
+        fn: t.Callable[..., t.Any],
+        *args: t.Any,
+        catch: t.Type[Exception] = Exception,
+        within: float | None = None,
+        **kwargs: t.Any,
+    ) -> Ok[t.Any, t.Any] | Err[t.Any, t.Any]:
+        try:
+            key = self._key(fn, args, kwargs)
+        except Exception as exc:
+            miss = ReplayMissError(f"no key for a call to {getattr(fn, '__qualname__', fn)!r}: {exc}")
+            miss.__cause__ = exc
+            return Err(miss)
+        outcome = self.next(key)
+        if outcome.is_none():
+            return Err(ReplayMissError(f"no recorded outcome for {key}"))
+        result, latency = outcome.unwrap()
+        if self.latency_scale:
+            delay = latency * self.latency_scale
+            budget = deadline.remaining()
+            if within is not None:
+                budget = within if budget is None else min(budget, within)
+            if budget is not None and delay > budget:
+                time.sleep(budget)
+                return Err(DeadlineExceeded(f"replayed {key} did not finish within {budget:.3f}s"))
+            time.sleep(delay)
+        return result
+
+    def close(self) -> None:
+        if self._buf is not None:
+            self._buf.close()
+            self._buf = None
+
+    def __enter__(self) -> Replayer:
+        self._original = _install(self)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._original is not None:
+            _uninstall(self, self._original)
+        self.close()
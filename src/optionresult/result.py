@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import typing as t
 
-from .exceptions import PanicError
+from . import deadline
+from .exceptions import ContextError, DeadlineExceeded, PanicError
 
 if t.TYPE_CHECKING:
+    from .fingerprint import Fingerprint  # pragma: no cover
+    from .lazy import LazyResult  # pragma: no cover
     from .option import Option  # pragma: no cover
 
 T = t.TypeVar("T")
@@ -12,13 +15,26 @@ U = t.TypeVar("U")
 E = t.TypeVar("E")
 R = t.TypeVar("R")
 F = t.TypeVar("F")
+# a result nested in another one
+N = t.TypeVar("N", bound="Result[t.Any, t.Any]")
 
 
 def is_same_exception(exc1: Exception, exc2: Exception) -> bool:
-    return type(exc1) == type(exc2) and exc1.args == exc2.args
+    if type(exc1) != type(exc2):
+        return False
+    if isinstance(exc1, ContextError) and isinstance(exc2, ContextError):
+        return exc1.message == exc2.message and is_same_error(exc1.source, exc2.source)
+    return exc1.args == exc2.args
+
+
+def is_same_error(err1: object, err2: object) -> bool:
+    if isinstance(err1, Exception) and isinstance(err2, Exception):
+        return is_same_exception(err1, err2)
+    return err1 == err2
 
 
 class Result(t.Generic[T, E]):
+    __slots__ = ("__weakref__",)
     __match_args__ = ("value",)
 
     @staticmethod
@@ -26,16 +42,48 @@ class Result(t.Generic[T, E]):
         fn: t.Callable[..., U],
         *args: t.Any,
         catch: t.Type[F] = Exception,
+        within: float | None = None,
         **kwargs: t.Any,
     ) -> Ok[U, F] | Err[U, F]:
+        """Call `fn`, returning its value as `Ok` or a caught exception as `Err`.
+
+        With `within` seconds, or inside `deadline.deadline(...)`, a call that
+        runs out of time returns `Err(DeadlineExceeded)` whatever `catch` is.
+        `catch` and `within` are never passed to `fn`; to give `fn` keyword
+        arguments with those names, bind them first with `functools.partial`.
+        """
+        if within is None and deadline.current_deadline.get() is None:
+            try:
+                return Ok(fn(*args, **kwargs))
+            except catch as exc:
+                return Err(exc)
         try:
-            return Ok(fn(*args, **kwargs))
+            return Ok(deadline.call(fn, args, kwargs, within))
+        except DeadlineExceeded as exc:
+            return Err(exc)  # type: ignore[arg-type]
         except catch as exc:
-            return Err(exc)
+            return Err(exc)  # type: ignore[arg-type]
+
+    @staticmethod
+    def lazy(
+        fn: t.Callable[..., U],
+        *args: t.Any,
+        catch: t.Type[F] = Exception,
+        **kwargs: t.Any,
+    ) -> LazyResult[U, F]:
+        from .lazy import LazyResult
+
+        return LazyResult(lambda: Result.of(fn, *args, catch=catch, **kwargs))
 
     def __init__(self, value: T | E):
         raise NotImplementedError
 
+    def __setattr__(self, name: str, value: t.Any) -> t.NoReturn:
+        raise AttributeError(f"`{type(self).__name__}` is immutable")
+
+    def __delattr__(self, name: str) -> t.NoReturn:
+        raise AttributeError(f"`{type(self).__name__}` is immutable")
+
     def is_ok(self) -> bool:
         raise NotImplementedError
 
@@ -105,6 +153,21 @@ class Result(t.Generic[T, E]):
     def unwrap_or_else(self, f: t.Callable[[E], T]) -> T:
         raise NotImplementedError
 
+    def flatten(self: Result[N, E]) -> N | Err[N, E]:
+        raise NotImplementedError
+
+    def transpose(self: Result[Option[U], E]) -> Option[Ok[U, E] | Err[Option[U], E]]:
+        raise NotImplementedError
+
+    def iter(self) -> t.Iterator[T]:
+        raise NotImplementedError
+
+    def context(self, msg: str, *args: object) -> Ok[T, E] | Err[T, ContextError]:
+        raise NotImplementedError
+
+    def with_context(self, f: t.Callable[[], str]) -> Ok[T, E] | Err[T, ContextError]:
+        raise NotImplementedError
+
     def __eq__(self, other: object) -> bool:
         raise NotImplementedError
 
@@ -113,8 +176,13 @@ class Result(t.Generic[T, E]):
 
 
 class Ok(Result[T, E]):
+    __slots__ = ("value",)
+
     def __init__(self, value: T) -> None:
-        self.value = value
+        _set_ok_value(self, value)
+
+    def __reduce__(self) -> tuple[type[Ok], tuple[T]]:
+        return (Ok, (self.value,))
 
     def is_ok(self) -> bool:
         return True
@@ -134,9 +202,9 @@ class Ok(Result[T, E]):
         return Option(self.unwrap())
 
     def err(self) -> Option[E]:
-        from .option import Option
+        from .option import _NONE
 
-        return Option(None)
+        return _NONE
 
     def map(self, f: t.Callable[[T], U]) -> Ok[U, E]:
         return Ok(f(self.unwrap()))
@@ -202,18 +270,42 @@ class Ok(Result[T, E]):
     def unwrap_or_else(self, f: t.Callable[[E], T]) -> T:
         return self.unwrap()
 
+    def flatten(self: Ok[N, E]) -> N:
+        return self.value
+
+    def transpose(self: Ok[Option[U], E]) -> Option[Ok[U, E] | Err[Option[U], E]]:
+        from .option import _NONE, Option
+
+        if self.value.value is None:
+            return _NONE
+        return Option(Ok(self.value.value))
+
+    def iter(self) -> t.Iterator[T]:
+        return iter((self.value,))
+
+    def context(self, msg: str, *args: object) -> Ok[T, E]:
+        return self
+
+    def with_context(self, f: t.Callable[[], str]) -> Ok[T, E]:
+        return self
+
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Ok):
             return self.value == other.value
-        return False
+        return NotImplemented
 
     def __repr__(self) -> str:
         return f"Ok({self.value!r})"
 
 
 class Err(Result[T, E]):
+    __slots__ = ("value", "_fingerprint", "_trail")
+
     def __init__(self, value: E) -> None:
-        self.value = value
+        _set_err_value(self, value)
+
+    def __reduce__(self) -> tuple[type[Err], tuple[E]]:
+        return (Err, (self.value,))
 
     def is_ok(self) -> bool:
         return False
@@ -228,9 +320,9 @@ class Err(Result[T, E]):
         return f(self.unwrap_err())
 
     def ok(self) -> Option[T]:
-        from .option import Option
+        from .option import _NONE
 
-        return Option(None)
+        return _NONE
 
     def err(self) -> Option[E]:
         from .option import Option
@@ -257,10 +349,10 @@ class Err(Result[T, E]):
         return self
 
     def expect(self, msg: str) -> t.NoReturn:
-        raise PanicError(f"{msg}: {self.unwrap_err()}")
+        raise PanicError(f"{msg}: {self.unwrap_err()}", trail=getattr(self, "_trail", None))
 
     def unwrap(self) -> t.NoReturn:
-        raise PanicError(self.unwrap_err())
+        raise PanicError(self.unwrap_err(), trail=getattr(self, "_trail", None))
 
     def expect_err(self, msg: str) -> E:
         return self.unwrap_err()
@@ -299,12 +391,42 @@ class Err(Result[T, E]):
     def unwrap_or_else(self, f: t.Callable[[E], T]) -> T:
         return f(self.unwrap_err())
 
+    def flatten(self) -> Err[T, E]:
+        return self
+
+    def transpose(self: Err[Option[U], E]) -> Option[Ok[U, E] | Err[Option[U], E]]:
+        from .option import Option
+
+        return Option(self)
+
+    def iter(self) -> t.Iterator[T]:
+        return iter(())
+
+    def context(self, msg: str, *args: object) -> Err[T, ContextError]:
+        return Err(ContextError(msg, self.value, args))
+
+    def with_context(self, f: t.Callable[[], str]) -> Err[T, ContextError]:
+        return Err(ContextError(f, self.value))
+
+    def fingerprint(self) -> Fingerprint:
+        fingerprint = getattr(self, "_fingerprint", None)
+        if fingerprint is None:
+            from .fingerprint import fingerprint as compute
+
+            # racing threads compute equal fingerprints, so the last store winning is harmless
+            fingerprint = compute(self.value)
+            object.__setattr__(self, "_fingerprint", fingerprint)
+        return fingerprint
+
     def __eq__(self, value: object) -> bool:
         if isinstance(value, Err):
-            if isinstance(self.value, Exception) and isinstance(value.value, Exception):
-                return is_same_exception(self.value, value.value)
-            return self.value == value.value
-        return False
+            return is_same_error(self.value, value.value)
+        return NotImplemented
 
     def __repr__(self) -> str:
         return f"Err({self.value!r})"
+
+
+# bound once: cheaper per construction than `object.__setattr__` on the immutable types
+_set_ok_value = Ok.__dict__["value"].__set__
+_set_err_value = Err.__dict__["value"].__set__
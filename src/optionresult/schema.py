@@ -0,0 +1,460 @@
+"""Compile dataclasses and TypedDicts into parsers that return a `Result`.
+
+`compile_parser(Record)` generates the source of a parse function specialized
+to `Record` once, caches it per type, and returns a callable that turns a
+mapping into `Ok(record)` or `Err(SchemaError)`. Each `FieldError` in the
+`SchemaError` carries the path of the offending field. By default parsing
+stops at the first error; `collect_all=True` reports every error instead.
+
+Primitive fields accept values of exactly that type. `int` and `float`
+additionally accept numeric strings, `int` accepts integral floats and
+`float` accepts ints, mirroring what `Result.of(int, value)` would coerce.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import dataclasses
+import enum
+import sys
+import threading
+import typing as t
+
+from .exceptions import SchemaError
+from .result import Err, Ok
+
+T = t.TypeVar("T")
+
+Path = t.Tuple[t.Union[str, int], ...]
+Converter = t.Callable[[t.Any], t.Any]
+
+
+class FieldError(t.NamedTuple):
+    path: Path
+    message: str
+
+    def __str__(self) -> str:
+        path = "".join(f"[{key}]" if isinstance(key, int) else f".{key}" for key in self.path).lstrip(".")
+        return f"{path or '<root>'}: {self.message}"
+
+
+def _invalid(message: str) -> SchemaError:
+    return SchemaError([FieldError((), message)])
+
+
+def _type_name(value: t.Any) -> str:
+    return type(value).__name__
+
+
+def _to_int(value: t.Any) -> int:
+    if isinstance(value, bool):
+        raise _invalid("expected int, got bool")
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            raise _invalid(f"invalid int literal {value!r}") from None
+    raise _invalid(f"expected int, got {_type_name(value)}")
+
+
+def _to_float(value: t.Any) -> float:
+    if isinstance(value, bool):
+        raise _invalid("expected float, got bool")
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            raise _invalid(f"invalid float literal {value!r}") from None
+    raise _invalid(f"expected float, got {_type_name(value)}")
+
+
+def _exact(tp: type) -> Converter:
+    def convert(value: t.Any) -> t.Any:
+        if isinstance(value, tp):
+            return value
+        raise _invalid(f"expected {tp.__name__}, got {_type_name(value)}")
+
+    return convert
+
+
+def _to_bytes(value: t.Any) -> bytes:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+    raise _invalid(f"expected bytes, got {_type_name(value)}")
+
+
+def _to_none(value: t.Any) -> None:
+    if value is not None:
+        raise _invalid(f"expected None, got {_type_name(value)}")
+
+
+_PRIMITIVES: dict[t.Any, Converter] = {
+    int: _to_int,
+    float: _to_float,
+    str: _exact(str),
+    bool: _exact(bool),
+    bytes: _to_bytes,
+    type(None): _to_none,
+}
+
+
+def _optional(inner: Converter) -> Converter:
+    def convert(value: t.Any) -> t.Any:
+        return None if value is None else inner(value)
+
+    return convert
+
+
+def _union(options: list[tuple[t.Any, Converter]]) -> Converter:
+    names = " | ".join(getattr(tp, "__name__", repr(tp)) for tp, _ in options)
+
+    def convert(value: t.Any) -> t.Any:
+        # prefer an exact type match so that e.g. `int | str` keeps "1" a str
+        for tp, _ in options:
+            if type(value) is tp:
+                return value
+        for _, inner in options:
+            try:
+                return inner(value)
+            except SchemaError:
+                pass
+        raise _invalid(f"expected {names}, got {_type_name(value)}")
+
+    return convert
+
+
+def _sequence(inner: Converter, build: t.Callable[[list[t.Any]], t.Any], collect_all: bool) -> Converter:
+    def convert(value: t.Any) -> t.Any:
+        if not isinstance(value, (list, tuple)):
+            raise _invalid(f"expected a sequence, got {_type_name(value)}")
+        items = []
+        errors: list[FieldError] = []
+        for index, item in enumerate(value):
+            try:
+                items.append(inner(item))
+            except SchemaError as exc:
+                exc = exc.prefixed(index)
+                if not collect_all:
+                    raise exc from None
+                errors.extend(exc.errors)
+        if errors:
+            raise SchemaError(errors)
+        try:
+            return build(items)
+        except TypeError as exc:
+            # e.g. unhashable items for a set
+            raise _invalid(str(exc)) from exc
+
+    return convert
+
+
+def _fixed_tuple(inners: list[Converter], collect_all: bool) -> Converter:
+    def convert(value: t.Any) -> t.Any:
+        if not isinstance(value, (list, tuple)):
+            raise _invalid(f"expected a sequence, got {_type_name(value)}")
+        if len(value) != len(inners):
+            raise _invalid(f"expected {len(inners)} items, got {len(value)}")
+        items = []
+        errors: list[FieldError] = []
+        for index, (inner, item) in enumerate(zip(inners, value)):
+            try:
+                items.append(inner(item))
+            except SchemaError as exc:
+                exc = exc.prefixed(index)
+                if not collect_all:
+                    raise exc from None
+                errors.extend(exc.errors)
+        if errors:
+            raise SchemaError(errors)
+        return tuple(items)
+
+    return convert
+
+
+def _mapping(key: Converter, inner: Converter, collect_all: bool) -> Converter:
+    def convert(value: t.Any) -> t.Any:
+        if not isinstance(value, collections.abc.Mapping):
+            raise _invalid(f"expected a mapping, got {_type_name(value)}")
+        items = {}
+        errors: list[FieldError] = []
+        for k, v in value.items():
+            try:
+                items[key(k)] = inner(v)
+                continue
+            except SchemaError as exc:
+                error = exc.prefixed(k)
+            except TypeError as exc:
+                # a key converted to an unhashable value
+                error = SchemaError([FieldError((k,), str(exc))])
+            if not collect_all:
+                raise error from None
+            errors.extend(error.errors)
+        if errors:
+            raise SchemaError(errors)
+        return items
+
+    return convert
+
+
+def _literal(values: tuple[t.Any, ...]) -> Converter:
+    allowed = set(values)
+
+    def convert(value: t.Any) -> t.Any:
+        try:
+            if value in allowed:
+                return value
+        except TypeError:
+            pass
+        raise _invalid(f"expected one of {', '.join(map(repr, values))}, got {value!r}")
+
+    return convert
+
+
+def _enum(tp: type[enum.Enum]) -> Converter:
+    def convert(value: t.Any) -> t.Any:
+        try:
+            return tp(value)
+        except (ValueError, TypeError):
+            raise _invalid(f"{value!r} is not a valid {tp.__name__}") from None
+
+    return convert
+
+
+def _is_typeddict(tp: t.Any) -> bool:
+    return isinstance(tp, type) and issubclass(tp, dict) and hasattr(tp, "__total__")
+
+
+_UNION_TYPES: tuple[t.Any, ...] = (t.Union,)
+if sys.version_info >= (3, 10):
+    import types
+
+    _UNION_TYPES += (types.UnionType,)
+
+
+class _Compiled:
+    __slots__ = ("raw", "parse")
+
+    raw: Converter
+    parse: t.Callable[[t.Any], t.Any]
+
+
+_lock = threading.RLock()
+_cache: dict[tuple[t.Any, bool], _Compiled] = {}
+_pending: dict[tuple[t.Any, bool], _Compiled] = {}
+# finished during the current top-level compile; they may call into records that are still
+# pending, so they are only published to `_cache` once the whole group has compiled
+_staged: dict[tuple[t.Any, bool], _Compiled] = {}
+
+
+def _converter(tp: t.Any, collect_all: bool) -> Converter:
+    if tp is t.Any or tp is object:
+        return lambda value: value
+    if tp in _PRIMITIVES:
+        return _PRIMITIVES[tp]
+    if dataclasses.is_dataclass(tp) or _is_typeddict(tp):
+        compiled = _compile(tp, collect_all)
+        # looked up at call time so that self-referential records can compile
+        return lambda value: compiled.raw(value)
+    if isinstance(tp, type) and issubclass(tp, enum.Enum):
+        return _enum(tp)
+
+    origin, args = t.get_origin(tp), t.get_args(tp)
+    if origin is None and tp in (list, tuple, set, frozenset, dict):
+        origin = tp
+    if origin in _UNION_TYPES:
+        options = [arg for arg in args if arg is not type(None)]
+        if len(options) == 1:
+            inner = _converter(options[0], collect_all)
+        else:
+            inner = _union([(arg, _converter(arg, collect_all)) for arg in options])
+        return _optional(inner) if len(options) < len(args) else inner
+    if origin is t.Literal:
+        return _literal(args)
+    if origin in (list, collections.abc.Sequence):
+        return _sequence(_converter(args[0] if args else t.Any, collect_all), list, collect_all)
+    if origin in (set, frozenset):
+        return _sequence(_converter(args[0] if args else t.Any, collect_all), origin, collect_all)
+    if origin is tuple:
+        if not args or (len(args) == 2 and args[1] is Ellipsis):
+            return _sequence(_converter(args[0] if args else t.Any, collect_all), tuple, collect_all)
+        return _fixed_tuple([_converter(arg, collect_all) for arg in args], collect_all)
+    if origin in (dict, collections.abc.Mapping):
+        key, value = args if args else (t.Any, t.Any)
+        return _mapping(_converter(key, collect_all), _converter(value, collect_all), collect_all)
+    raise TypeError(f"unsupported schema type: {tp!r}")
+
+
+class _Field(t.NamedTuple):
+    key: str
+    tp: t.Any
+    required: bool
+    default: t.Any
+    factory: t.Any
+
+
+def _type_hints(tp: type, initvars: set[str]) -> dict[str, t.Any]:
+    """`t.get_type_hints(tp)`, with the dataclass InitVars in `initvars` resolved to the type they wrap.
+
+    Before 3.11 `get_type_hints` rejects a string `InitVar[...]`, as written under
+    `from __future__ import annotations`, so those are evaluated from the field.
+    """
+    if not initvars:
+        return t.get_type_hints(tp)
+    fields = tp.__dataclass_fields__  # type: ignore[attr-defined]
+    hints: dict[str, t.Any] = {}
+    for base in reversed(tp.__mro__):
+        annotations = base.__dict__.get("__annotations__", {})
+        if not annotations:
+            continue
+        namespace = {"__module__": base.__module__, "__annotations__": {k: v for k, v in annotations.items() if k not in initvars}}
+        localns = dict(vars(base))
+        hints.update(t.get_type_hints(type(base.__name__, (), namespace), localns=localns))
+        for name in initvars.intersection(annotations):
+            hint = fields[name].type
+            if isinstance(hint, str):
+                hint = eval(hint, vars(sys.modules[base.__module__]), localns)  # noqa: S307
+            hints[name] = hint.type if isinstance(hint, dataclasses.InitVar) else hint
+    return hints
+
+
+def _fields(tp: type) -> list[_Field]:
+    if dataclasses.is_dataclass(tp):
+        init = {field.name for field in dataclasses.fields(tp) if field.init}
+        # `__dataclass_fields__` also holds the InitVars, which `__init__` takes but `fields()` omits
+        dataclass_fields = tp.__dataclass_fields__  # type: ignore[attr-defined]
+        initvars = {name for name, field in dataclass_fields.items() if field._field_type is dataclasses._FIELD_INITVAR}  # type: ignore[attr-defined]
+        hints = _type_hints(tp, initvars)
+        fields = []
+        for field in dataclass_fields.values():
+            if field.name not in init and field.name not in initvars:
+                continue
+            required = field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING
+            fields.append(_Field(field.name, hints[field.name], required, field.default, field.default_factory))
+        return fields
+    hints = t.get_type_hints(tp)
+    required = getattr(tp, "__required_keys__", frozenset(hints) if tp.__total__ else frozenset())
+    return [_Field(key, hint, key in required, dataclasses.MISSING, dataclasses.MISSING) for key, hint in hints.items()]
+
+
+def _generate(tp: type, collect_all: bool) -> Converter:
+    is_dataclass = dataclasses.is_dataclass(tp)
+    namespace: dict[str, t.Any] = {
+        "Mapping": collections.abc.Mapping,
+        "SchemaError": SchemaError,
+        "FieldError": FieldError,
+        "cls": tp,
+    }
+    fail = "errors.extend(exc.errors)" if collect_all else "raise exc from None"
+    lines = [
+        "def parse(data):",
+        "    if not isinstance(data, Mapping):",
+        "        raise SchemaError([FieldError((), f'expected a mapping, got {type(data).__name__}')])",
+    ]
+    if collect_all:
+        lines.append("    errors = []")
+    if not is_dataclass:
+        lines.append("    record = {}")
+    args = []
+    for i, field in enumerate(_fields(tp)):
+        name = f"f{i}"
+        convert = _converter(field.tp, collect_all)
+        namespace[f"convert_{name}"] = convert
+        namespace[f"key_{name}"] = field.key
+        fast = f"{name} if {name}.__class__ is {field.tp.__name__} else " if field.tp in (int, float, str, bool) else ""
+        lines += [
+            "    try:",
+            f"        {name} = data[key_{name}]",
+            "    except KeyError:",
+        ]
+        if field.required:
+            lines += [
+                f"        exc = SchemaError([FieldError((key_{name},), 'missing required field')])",
+                f"        {fail}",
+            ]
+        elif field.factory is not dataclasses.MISSING:
+            namespace[f"factory_{name}"] = field.factory
+            lines.append(f"        {name} = factory_{name}()")
+        elif field.default is not dataclasses.MISSING:
+            namespace[f"default_{name}"] = field.default
+            lines.append(f"        {name} = default_{name}")
+        else:
+            lines.append("        pass")
+        lines += [
+            "    else:",
+            "        try:",
+            f"            {name} = {fast}convert_{name}({name})",
+            "        except SchemaError as exc:",
+            f"            exc = exc.prefixed(key_{name})",
+            f"            {fail}",
+        ]
+        if is_dataclass:
+            args.append(f"{field.key}={name}")
+        else:
+            lines += ["        else:", f"            record[key_{name}] = {name}"]
+    if collect_all:
+        lines += ["    if errors:", "        raise SchemaError(errors)"]
+    if is_dataclass:
+        # `__init__`/`__post_init__` may still reject the payload, e.g. a failed invariant
+        lines += [
+            "    try:",
+            f"        return cls({', '.join(args)})",
+            "    except (TypeError, ValueError) as exc:",
+            "        raise SchemaError([FieldError((), str(exc))]) from exc",
+        ]
+    else:
+        lines.append("    return record")
+    exec("\n".join(lines), namespace)  # noqa: S102
+    return namespace["parse"]
+
+
+def _compile(tp: t.Any, collect_all: bool) -> _Compiled:
+    key = (tp, collect_all)
+    compiled = _cache.get(key)
+    if compiled is not None:
+        return compiled
+    with _lock:
+        # a record that refers to itself finds its own half-built entry in `_pending`
+        compiled = _cache.get(key) or _pending.get(key) or _staged.get(key)
+        if compiled is not None:
+            return compiled
+        outermost = not _pending
+        compiled = _pending[key] = _Compiled()
+        try:
+            raw = _generate(tp, collect_all)
+        except BaseException:
+            if outermost:
+                _staged.clear()
+            raise
+        finally:
+            del _pending[key]
+
+        def parse(data: t.Any) -> Ok[t.Any, SchemaError] | Err[t.Any, SchemaError]:
+            try:
+                return Ok(raw(data))
+            except SchemaError as exc:
+                return Err(exc)
+
+        compiled.raw = raw
+        compiled.parse = parse
+        _staged[key] = compiled
+        if outermost:
+            _cache.update(_staged)
+            _staged.clear()
+    return compiled
+
+
+def compile_parser(tp: type[T], *, collect_all: bool = False) -> t.Callable[[t.Any], Ok[T, SchemaError] | Err[T, SchemaError]]:
+    """Return the cached parser for the dataclass or TypedDict `tp`."""
+    if not (dataclasses.is_dataclass(tp) or _is_typeddict(tp)):
+        raise TypeError(f"expected a dataclass or TypedDict, got {tp!r}")
+    return _compile(tp, collect_all).parse
+
+
+def parse(tp: type[T], data: t.Any, *, collect_all: bool = False) -> Ok[T, SchemaError] | Err[T, SchemaError]:
+    return compile_parser(tp, collect_all=collect_all)(data)
@@ -0,0 +1,220 @@
+"""Pass large sequences of `Ok`/`Err` between processes through shared memory.
+
+`pack_results` writes results into one `multiprocessing.shared_memory`
+segment laid out as::
+
+    header   magic, count
+    tags     one byte per result: Err flag | payload kind
+    offsets  count + 1 little-endian uint64 offsets into the value buffer
+    values   concatenated payloads
+
+`None`, `bool`, `int` (64-bit), `float`, `bytes` and `str` payloads are
+stored natively; anything else is pickled into the value buffer as a side
+record. `SharedResults.attach(name)` opens a read-only view in another
+process that decodes each result only when it is accessed.
+"""
+
+from __future__ import annotations
+
+import array
+import itertools
+import pickle
+import struct
+import sys
+import typing as t
+from multiprocessing import shared_memory
+
+from .result import Err, Ok
+
+MAGIC = b"ORSHM\x00\x00\x01"
+_HEADER = struct.Struct("<8sQ")
+_OFFSET = struct.Struct("<Q")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+
+_ERR = 0x80
+_NONE, _FALSE, _TRUE, _INT_KIND, _FLOAT_KIND, _BYTES, _STR, _PICKLE = range(8)
+_INT_MIN, _INT_MAX = -(2**63), 2**63 - 1
+
+
+def _encode(value: t.Any) -> tuple[int, bytes]:
+    cls = type(value)
+    if value is None:
+        return _NONE, b""
+    if cls is bool:
+        return (_TRUE if value else _FALSE), b""
+    if cls is int and _INT_MIN <= value <= _INT_MAX:
+        return _INT_KIND, _INT.pack(value)
+    if cls is float:
+        return _FLOAT_KIND, _FLOAT.pack(value)
+    if cls is bytes:
+        return _BYTES, value
+    if cls is str:
+        return _STR, value.encode("utf-8", "surrogatepass")
+    return _PICKLE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode(tag: int, buf: t.Any, start: int, end: int) -> Ok[t.Any, t.Any] | Err[t.Any, t.Any]:
+    kind = tag & ~_ERR
+    if kind == _NONE:
+        value: t.Any = None
+    elif kind == _FALSE:
+        value = False
+    elif kind == _TRUE:
+        value = True
+    elif kind == _INT_KIND:
+        value = _INT.unpack_from(buf, start)[0]
+    elif kind == _FLOAT_KIND:
+        value = _FLOAT.unpack_from(buf, start)[0]
+    elif kind == _BYTES:
+        value = bytes(buf[start:end])
+    elif kind == _STR:
+        value = str(buf[start:end], "utf-8", "surrogatepass")
+    else:
+        value = pickle.loads(buf[start:end])
+    return Err(value) if tag & _ERR else Ok(value)
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+class SharedResults(t.Sequence[t.Union[Ok[t.Any, t.Any], Err[t.Any, t.Any]]]):
+    """A read-only, lazily decoded sequence of results in shared memory."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, *, owner: bool = False) -> None:
+        self._shm = shm
+        self._owner = owner
+        self._buf: memoryview | None = t.cast(memoryview, shm.buf).toreadonly()
+        magic, self._count = _HEADER.unpack_from(self._buf)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"shared memory segment {shm.name!r} does not hold packed results")
+        self._tags = _HEADER.size
+        self._offsets = _align(self._tags + self._count)
+        self._values = self._offsets + (self._count + 1) * _OFFSET.size
+
+    @classmethod
+    def attach(cls, name: str) -> SharedResults:
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name, track=False)
+        else:
+            from multiprocessing import resource_tracker
+
+            # A tracker inherited from the creating process already knows the segment,
+            # so registering it again is a no-op. A tracker started by this attach would
+            # unlink the segment when this process exits (bpo-38119), so drop that entry.
+            inherited = getattr(resource_tracker._resource_tracker, "_fd", None) is not None
+            shm = shared_memory.SharedMemory(name)
+            if sys.platform != "win32" and not inherited:
+                resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        return cls(shm)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def size(self) -> int:
+        return self._shm.size
+
+    def _view(self) -> memoryview:
+        if self._buf is None:
+            raise ValueError("operation on closed SharedResults")
+        return self._buf
+
+    def _get(self, index: int) -> Ok[t.Any, t.Any] | Err[t.Any, t.Any]:
+        buf = self._view()
+        tag = buf[self._tags + index]
+        offset = self._offsets + index * _OFFSET.size
+        start = self._values + _OFFSET.unpack_from(buf, offset)[0]
+        end = self._values + _OFFSET.unpack_from(buf, offset + _OFFSET.size)[0]
+        return _decode(tag, buf, start, end)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @t.overload
+    def __getitem__(self, index: int) -> Ok[t.Any, t.Any] | Err[t.Any, t.Any]: ...
+    @t.overload
+    def __getitem__(self, index: slice) -> list[Ok[t.Any, t.Any] | Err[t.Any, t.Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> Ok[t.Any, t.Any] | Err[t.Any, t.Any] | list[Ok[t.Any, t.Any] | Err[t.Any, t.Any]]:
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(self._count))]
+        position = index + self._count if index < 0 else index
+        if not 0 <= position < self._count:
+            raise IndexError("SharedResults index out of range")
+        return self._get(position)
+
+    def __iter__(self) -> t.Iterator[Ok[t.Any, t.Any] | Err[t.Any, t.Any]]:
+        for index in range(self._count):
+            yield self._get(index)
+
+    def close(self) -> None:
+        if self._buf is not None:
+            self._buf.release()
+            self._buf = None
+            self._shm.close()
+
+    def __del__(self) -> None:
+        # the read-only export pins the mapping, so SharedMemory could not close it
+        buf = getattr(self, "_buf", None)
+        if buf is not None:
+            buf.release()
+
+    def unlink(self) -> None:
+        """Destroy the segment; only the process that packed it should call this."""
+        self._shm.unlink()
+
+    def __enter__(self) -> SharedResults:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        # sending the view to another process only sends the segment name
+        return (SharedResults.attach, (self.name,))
+
+    def __repr__(self) -> str:
+        return f"SharedResults(name={self.name!r}, count={self._count})"
+
+
+def pack_results(results: t.Iterable[Ok[t.Any, t.Any] | Err[t.Any, t.Any]], *, name: str | None = None) -> SharedResults:
+    """Copy `results` into a new shared memory segment owned by the caller.
+
+    The returned view unlinks the segment when used as a context manager;
+    otherwise call `unlink()` once every consumer has attached.
+    """
+    tags = bytearray()
+    payloads: list[bytes] = []
+    for result in results:
+        kind, payload = _encode(result.value)
+        tags.append(kind | (_ERR if result.is_err() else 0))
+        payloads.append(payload)
+
+    count = len(payloads)
+    lengths = list(map(len, payloads))
+    total = sum(lengths)
+    positions = array.array("Q", [0])
+    positions.extend(itertools.accumulate(lengths))
+    if sys.byteorder != "little":
+        positions.byteswap()
+    offsets = _align(_HEADER.size + count)
+    values = offsets + (count + 1) * _OFFSET.size
+    shm = shared_memory.SharedMemory(name, create=True, size=max(values + total, 1))
+    try:
+        buf = t.cast(memoryview, shm.buf)
+        _HEADER.pack_into(buf, 0, MAGIC, count)
+        buf[_HEADER.size : _HEADER.size + count] = tags
+        buf[offsets:values] = positions.tobytes()
+        buf[values : values + total] = b"".join(payloads)
+        del buf
+        return SharedResults(shm, owner=True)
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
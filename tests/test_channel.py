@@ -0,0 +1,186 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from optionresult import ChannelClosedError, Err, Ok
+from optionresult.channel import AsyncResultChannel, ResultChannel
+
+
+def delivered(error: BaseException) -> int:
+    # set by the channel on the exception that interrupts a batch
+    return getattr(error, "delivered")
+
+
+class TestResultChannel(unittest.TestCase):
+    def test_fifo(self):
+        channel = ResultChannel()
+        channel.put(Ok(1))
+        channel.put_many([Err("a"), Ok(2)])
+        self.assertEqual(len(channel), 3)
+        self.assertEqual(channel.get(), Ok(1))
+        self.assertEqual(channel.get_many(10), [Err("a"), Ok(2)])
+
+    def test_prioritize_errors(self):
+        channel = ResultChannel(prioritize_errors=True)
+        channel.put_many([Ok(1), Ok(2), Err("a"), Ok(3), Err("b")])
+        self.assertEqual(channel.get_many(3), [Err("a"), Err("b"), Ok(1)])
+        self.assertEqual(channel.get_many(3), [Ok(2), Ok(3)])
+
+    def test_backpressure(self):
+        channel = ResultChannel(2)
+        channel.put_many([Ok(1), Ok(2)])
+        with self.assertRaises(TimeoutError):
+            channel.put(Ok(3), timeout=0.01)
+        with self.assertRaises(TimeoutError):
+            ResultChannel().get(timeout=0.01)
+
+    def test_batches_larger_than_capacity(self):
+        channel = ResultChannel(3)
+        items = [Ok(i) for i in range(100)]
+        producer = threading.Thread(target=lambda: (channel.put_many(items), channel.close()))
+        producer.start()
+        received = []
+        while True:
+            try:
+                batch = channel.get_many(5, timeout=5)
+            except ChannelClosedError:
+                break
+            self.assertLessEqual(len(batch), 3)
+            received.extend(batch)
+        producer.join()
+        self.assertEqual(received, items)
+
+    def test_partial_batches(self):
+        channel = ResultChannel(3)
+        channel.put(Ok(0))
+        with self.assertRaises(TimeoutError) as caught:
+            channel.put_many([Ok(1), Ok(2), Ok(3)], timeout=0.01)
+        self.assertEqual(delivered(caught.exception), 0)
+        self.assertEqual(len(channel), 1)
+
+        channel.get()
+        with self.assertRaises(TimeoutError) as caught:
+            channel.put_many([Ok(i) for i in range(5)], timeout=0.01)
+        self.assertEqual(delivered(caught.exception), 3)
+        self.assertEqual(channel.get_many(5), [Ok(0), Ok(1), Ok(2)])
+
+        channel.put(Ok(0))
+        threading.Timer(0.05, channel.close).start()
+        with self.assertRaises(ChannelClosedError) as closed:
+            channel.put_many([Ok(1), Ok(2), Ok(3)], timeout=5)
+        self.assertEqual(delivered(closed.exception), 0)
+        self.assertEqual(len(channel), 1)
+
+    def test_blocked_batch_does_not_starve_other_producers(self):
+        channel = ResultChannel(2)
+        channel.put_many([Ok(0), Ok(0)])
+        batch = threading.Thread(target=lambda: self.assertRaises(TimeoutError, channel.put_many, [Ok(1), Ok(2)], timeout=1))
+        single = threading.Thread(target=channel.put, args=(Ok(3), 2))
+        batch.start()
+        time.sleep(0.05)
+        single.start()
+        time.sleep(0.05)
+        channel.get()
+        single.join(0.5)
+        self.assertFalse(single.is_alive())
+        batch.join(5)
+
+    def test_close(self):
+        channel = ResultChannel()
+        channel.put(Ok(1))
+        channel.close(ValueError("shutdown"))
+        with self.assertRaises(ChannelClosedError):
+            channel.put(Ok(2))
+        self.assertTrue(channel.closed)
+        self.assertEqual(list(channel), [Ok(1), Err(ValueError("shutdown"))])
+        with self.assertRaises(ChannelClosedError):
+            channel.get()
+
+    def test_close_wakes_consumers(self):
+        channel = ResultChannel()
+        results = []
+        consumers = [threading.Thread(target=lambda: results.append(list(channel))) for _ in range(4)]
+        for consumer in consumers:
+            consumer.start()
+        channel.close("done")
+        for consumer in consumers:
+            consumer.join(5)
+        self.assertEqual(sorted(map(len, results)), [0, 0, 0, 1])
+
+    def test_threads(self):
+        channel = ResultChannel(16)
+        producers = [threading.Thread(target=channel.put_many, args=([Ok(i) for i in range(1000)],)) for _ in range(4)]
+        for producer in producers:
+            producer.start()
+        received = []
+        while len(received) < 4000:
+            received.extend(channel.get_many(64, timeout=5))
+        for producer in producers:
+            producer.join()
+        self.assertEqual(sorted(r.unwrap() for r in received), sorted(list(range(1000)) * 4))
+
+
+class TestAsyncResultChannel(unittest.TestCase):
+    def run_async(self, coro):
+        return asyncio.run(asyncio.wait_for(coro, 5))
+
+    def test_fifo_and_priority(self):
+        async def main():
+            channel = AsyncResultChannel(prioritize_errors=True)
+            await channel.put_many([Ok(1), Err("a"), Ok(2)])
+            self.assertEqual(await channel.get(), Err("a"))
+            self.assertEqual(await channel.get_many(5), [Ok(1), Ok(2)])
+
+        self.run_async(main())
+
+    def test_backpressure(self):
+        async def main():
+            channel = AsyncResultChannel(2)
+            items = [Ok(i) for i in range(10)]
+
+            async def produce():
+                await channel.put_many(items)
+                await channel.close(RuntimeError("end"))
+
+            task = asyncio.ensure_future(produce())
+            received = [item async for item in channel]
+            await task
+            self.assertEqual(received, items + [Err(RuntimeError("end"))])
+            with self.assertRaises(ChannelClosedError):
+                await channel.get()
+
+        self.run_async(main())
+
+    def test_partial_batches(self):
+        async def main():
+            channel = AsyncResultChannel(3)
+            await channel.put(Ok(0))
+            with self.assertRaises(TimeoutError) as caught:
+                await channel.put_many([Ok(1), Ok(2), Ok(3)], timeout=0.01)
+            self.assertEqual(delivered(caught.exception), 0)
+            self.assertEqual(len(channel), 1)
+
+            await channel.get()
+            with self.assertRaises(TimeoutError) as caught:
+                await channel.put_many([Ok(i) for i in range(5)], timeout=0.01)
+            self.assertEqual(delivered(caught.exception), 3)
+
+            await channel.close()
+            with self.assertRaises(ChannelClosedError) as closed:
+                await channel.put_many([Ok(1)])
+            self.assertEqual(delivered(closed.exception), 0)
+
+        self.run_async(main())
+
+    def test_timeout(self):
+        async def main():
+            channel = AsyncResultChannel(1)
+            await channel.put(Ok(1))
+            with self.assertRaises(TimeoutError):
+                await channel.put(Ok(2), timeout=0.01)
+            await channel.get()
+            with self.assertRaises(TimeoutError):
+                await channel.get(timeout=0.01)
+
+        self.run_async(main())
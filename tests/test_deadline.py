@@ -0,0 +1,120 @@
+import functools
+import threading
+import unittest
+from unittest import mock
+
+from optionresult import DeadlineExceeded, Ok, Option, Result
+from optionresult import deadline as deadlines
+from optionresult.deadline import deadline, remaining
+
+
+class Blocker:
+    """A stub that blocks until the test releases it."""
+
+    def __init__(self, test):
+        self.release = threading.Event()
+        self.calls = 0
+        test.addCleanup(self.release.set)
+
+    def __call__(self, value=None):
+        self.calls += 1
+        self.release.wait(5)
+        return value
+
+
+def budget() -> float:
+    seconds = remaining()
+    if seconds is None:
+        raise AssertionError("no deadline is active")
+    return seconds
+
+
+class TestTimeout(unittest.TestCase):
+    def test_returns_ok_within_timeout(self):
+        self.assertEqual(Result.of(int, "42", within=5), Ok(42))
+        self.assertEqual(Option.of(int, "42", within=5), Option(42))
+
+    def test_timeout_returns_err(self):
+        blocker = Blocker(self)
+        result = Result.of(blocker, 1, within=0.01)
+        self.assertTrue(result.is_err())
+        self.assertIsInstance(result.value, DeadlineExceeded)
+        self.assertIsInstance(result.value, TimeoutError)
+
+    def test_timeout_ignores_catch(self):
+        blocker = Blocker(self)
+        self.assertIsInstance(Result.of(blocker, catch=KeyError, within=0.01).value, DeadlineExceeded)
+
+    def test_option_timeout_returns_none(self):
+        blocker = Blocker(self)
+        self.assertEqual(Option.of(blocker, 1, within=0.01), Option(None))
+
+    def test_exceptions_are_still_caught(self):
+        result = Result.of(int, "x", within=5)
+        self.assertIsInstance(result.value, ValueError)
+        with self.assertRaises(ValueError):
+            Result.of(int, "x", catch=KeyError, within=5)
+
+    def test_no_timeout_runs_inline(self):
+        with mock.patch.object(deadlines, "_get_executor", side_effect=AssertionError("pool used")):
+            self.assertEqual(Result.of(threading.get_ident), Ok(threading.get_ident()))
+            self.assertEqual(Option.of(threading.get_ident), Option(threading.get_ident()))
+
+    def test_fn_keeps_its_own_timeout(self):
+        def connect(host, timeout=None, within=None):
+            return host, timeout, within
+
+        with mock.patch.object(deadlines, "_get_executor", side_effect=AssertionError("pool used")):
+            self.assertEqual(Result.of(connect, "db", timeout=3), Ok(("db", 3, None)))
+        self.assertEqual(Result.of(functools.partial(connect, within=2), "db", within=5), Ok(("db", None, 2)))
+
+
+class TestDeadline(unittest.TestCase):
+    def test_remaining(self):
+        self.assertIsNone(remaining())
+        with deadline(10):
+            self.assertLessEqual(budget(), 10)
+            with deadline(20):
+                self.assertLessEqual(budget(), 10)
+            with deadline(1):
+                self.assertLessEqual(budget(), 1)
+        self.assertIsNone(remaining())
+
+    def test_deadline_bounds_calls(self):
+        blocker = Blocker(self)
+        with deadline(0.01):
+            self.assertIsInstance(Result.of(blocker).value, DeadlineExceeded)
+
+    def test_expired_deadline_skips_call(self):
+        blocker = Blocker(self)
+        with deadline(0):
+            self.assertIsInstance(Result.of(blocker).value, DeadlineExceeded)
+        self.assertEqual(blocker.calls, 0)
+
+    def test_propagates_to_nested_calls(self):
+        blocker = Blocker(self)
+        outer = threading.Event()
+
+        def nested():
+            seen = budget()
+            inner = Result.of(threading.get_ident)
+            outer.set()
+            return seen, inner, threading.get_ident()
+
+        with deadline(5):
+            seen, inner, worker = Result.of(nested).unwrap()
+        self.assertTrue(outer.is_set())
+        self.assertLessEqual(seen, 5)
+        # the enclosing call already enforces the deadline, so the nested one runs inline
+        self.assertEqual(inner, Ok(worker))
+        self.assertNotEqual(worker, threading.get_ident())
+
+        def tighter():
+            return Result.of(blocker, within=0.01)
+
+        with deadline(5):
+            self.assertIsInstance(Result.of(tighter).unwrap().value, DeadlineExceeded)
+
+    def test_lazy_result_timeout(self):
+        blocker = Blocker(self)
+        self.assertIsInstance(Result.lazy(blocker, within=0.01).value, DeadlineExceeded)
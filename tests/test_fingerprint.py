@@ -0,0 +1,104 @@
+import traceback
+import unittest
+
+from optionresult import Err, ErrorIndex, Ok, Option, Result
+from optionresult.fingerprint import Fingerprint, fingerprint
+
+
+def fail(message):
+    raise ValueError(message)
+
+
+def fail_elsewhere(message):
+    raise ValueError(message)
+
+
+class Opaque:
+    pass
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_exception(self):
+        fp = fingerprint(KeyError("a", 1))
+        self.assertEqual(fp, Fingerprint("builtins.KeyError", ("a", 1), None))
+
+    def test_normalize(self):
+        self.assertEqual(fingerprint(ValueError(["a"], {"b": [1]})).args, (("a",), (("'b'", (1,)),)))
+        self.assertEqual(fingerprint(ValueError(Opaque())), fingerprint(ValueError(Opaque())))
+        self.assertEqual(fingerprint("error"), Fingerprint("builtins.str", ("error",), None))
+
+    def test_site(self):
+        a = Result.of(fail, "boom").unwrap_err()
+        b = Result.of(fail, "boom").unwrap_err()
+        c = Result.of(fail_elsewhere, "boom").unwrap_err()
+        self.assertIsNotNone(fingerprint(a).site)
+        self.assertEqual(fingerprint(a), fingerprint(b))
+        self.assertNotEqual(fingerprint(a), fingerprint(c))
+        self.assertEqual(fingerprint(a).without_site(), fingerprint(c).without_site())
+
+    def test_builtin_site(self):
+        a = fingerprint(Result.of(int, "x").unwrap_err())
+        b = fingerprint(Result.of(int, "x").unwrap_err())
+        c = fingerprint(Result.lazy(int, "x").unwrap_err())
+        sites = [fp.site for fp in (a, b, c)]
+        self.assertTrue(all(site is not None and site[0].endswith("test_fingerprint.py") for site in sites))
+        self.assertEqual(len(set(sites)), 3)
+        self.assertEqual(a.without_site(), b.without_site())
+        # the traceback is left as raised
+        self.assertEqual(len(list(traceback.walk_tb(Result.of(int, "x").unwrap_err().__traceback__))), 1)
+
+    def test_context(self):
+        def wrap(error):
+            return Err(error).with_context(lambda: "saving").fingerprint()
+
+        self.assertNotEqual(wrap(ValueError("disk full")), wrap(ValueError("bad port")))
+        self.assertEqual(wrap(ValueError("disk full")), wrap(ValueError("disk full")))
+        loading = [Err(KeyError(key)).context("loading {}", name).fingerprint() for key, name in (("k", "c"), ("zz", "c"), ("k", "d"))]
+        self.assertNotEqual(loading[0], loading[1])
+        self.assertEqual(loading[0], loading[2])
+        self.assertNotEqual(loading[0], Err(KeyError("k")).context("saving {}", "c").fingerprint())
+        self.assertEqual(loading[0].args[:2], fingerprint(KeyError("k"))[:2])
+
+    def test_context_site(self):
+        wrapped = fingerprint(Result.of(fail, "boom").context("running").unwrap_err())
+        self.assertEqual(wrapped.site, fingerprint(Result.of(fail, "boom").unwrap_err()).site)
+
+    def test_cached(self):
+        err = Err(ValueError("x"))
+        self.assertIs(err.fingerprint(), err.fingerprint())
+
+
+class TestErrorIndex(unittest.TestCase):
+    def test_add(self):
+        index = ErrorIndex(exemplars=2)
+        self.assertEqual(index.add(Ok(1)), Option(None))
+        errors = [Err(ValueError("a")) for _ in range(3)] + [Err(KeyError("b"))]
+        index.extend(errors)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.total, 4)
+
+        group = index.most_common(1)[0]
+        self.assertEqual(group.count, 3)
+        self.assertIs(group.first, errors[0])
+        self.assertIs(group.last, errors[2])
+        self.assertEqual(list(group.exemplars), errors[1:3])
+        self.assertIs(index.get(errors[3].fingerprint()).unwrap().first, errors[3])
+
+    def test_lazy(self):
+        index = ErrorIndex()
+        self.assertEqual(index.add(Result.lazy(int, "1")), Option(None))
+        group = index.add(Result.lazy(int, "x")).unwrap()
+        self.assertEqual(group.fingerprint.kind, "builtins.ValueError")
+        self.assertEqual(len(index), 1)
+
+    def test_site(self):
+        errors = [Result.of(fail, "boom"), Result.of(fail_elsewhere, "boom")]
+
+        by_site = ErrorIndex()
+        by_site.extend(errors)
+        self.assertEqual(len(by_site), 2)
+
+        merged = ErrorIndex(site=False)
+        merged.extend(errors)
+        self.assertEqual(len(merged), 1)
+        self.assertEqual(merged.get(fingerprint(errors[0].unwrap_err())).unwrap().count, 2)
@@ -0,0 +1,173 @@
+import threading
+import time
+import typing as t
+import unittest
+
+from optionresult import Err, LazyOption, LazyResult, Ok, Option, PanicError, Result, Slot
+
+THREADS = 16
+
+
+class Counter:
+    def __init__(self, value: t.Any = 42, delay=0.0):
+        self.calls = 0
+        self.value = value
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return self.value
+
+
+def contend(fn):
+    barrier = threading.Barrier(THREADS)
+    results = [None] * THREADS
+
+    def worker(i):
+        barrier.wait()
+        results[i] = fn()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSlot(unittest.TestCase):
+    def test_get(self):
+        self.assertEqual(Slot().get(), Option(None))
+        self.assertEqual(Slot(2).get(), Option(2))
+        self.assertTrue(Slot(2).is_some())
+        self.assertTrue(Slot().is_none())
+
+    def test_get_or_insert_with(self):
+        slot = Slot()
+        self.assertEqual(slot.get_or_insert_with(lambda: 5), 5)
+        self.assertEqual(slot.get_or_insert_with(lambda: 6), 5)
+        self.assertEqual(repr(slot), "Slot(5)")
+        with self.assertRaises(ValueError):
+            Slot().get_or_insert_with(lambda: None)
+
+    def test_take(self):
+        slot = Slot(2)
+        self.assertEqual(slot.take(), Option(2))
+        self.assertTrue(slot.is_none())
+        self.assertEqual(slot.take(), Option(None))
+
+    def test_replace(self):
+        slot = Slot(2)
+        self.assertEqual(slot.replace(5), Option(2))
+        self.assertEqual(slot.get(), Option(5))
+        self.assertEqual(Slot().replace(3), Option(None))
+
+    def test_insert(self):
+        slot = Slot()
+        self.assertEqual(slot.insert(1), 1)
+        self.assertEqual(slot.insert(2), 2)
+        self.assertEqual(slot.get(), Option(2))
+
+    def test_get_or_insert_with_contention(self):
+        slot = Slot()
+        counter = Counter(delay=0.01)
+        self.assertEqual(contend(lambda: slot.get_or_insert_with(counter)), [42] * THREADS)
+        self.assertEqual(counter.calls, 1)
+
+
+class TestLazyOption(unittest.TestCase):
+    def test_deferred(self):
+        counter = Counter()
+        x = Option.lazy(counter)
+        self.assertIsInstance(x, LazyOption)
+        self.assertFalse(x.is_evaluated())
+        self.assertEqual(counter.calls, 0)
+        self.assertTrue(x.is_some())
+        self.assertEqual(x.unwrap(), 42)
+        self.assertEqual(x.map(lambda v: v + 1), Option(43))
+        self.assertEqual(counter.calls, 1)
+
+    def test_none_is_memoized(self):
+        counter = Counter(value=None)
+        x = Option.lazy(counter)
+        self.assertTrue(x.is_none())
+        self.assertEqual(x, Option(None))
+        self.assertEqual(counter.calls, 1)
+
+    def test_args(self):
+        self.assertEqual(Option.lazy(int, "12", base=8), Option(10))
+
+    def test_eq_and_repr(self):
+        x = Option.lazy(lambda: "foo")
+        self.assertTrue(repr(x).startswith("Option.lazy("))
+        self.assertEqual(Option("foo"), x)
+        self.assertEqual(repr(x), "Some('foo')")
+
+    def test_exception_is_retried(self):
+        calls = []
+
+        def flaky():
+            calls.append(None)
+            if len(calls) == 1:
+                raise KeyError("first")
+            return "second"
+
+        x = Option.lazy(flaky)
+        with self.assertRaises(KeyError):
+            x.is_some()
+        self.assertEqual(x.unwrap(), "second")
+        self.assertEqual(len(calls), 2)
+
+    def test_contention(self):
+        counter = Counter(delay=0.01)
+        x = Option.lazy(counter)
+        self.assertEqual(contend(x.unwrap), [42] * THREADS)
+        self.assertEqual(counter.calls, 1)
+
+
+class TestLazyResult(unittest.TestCase):
+    def test_deferred(self):
+        counter = Counter()
+        x = Result.lazy(counter)
+        self.assertIsInstance(x, LazyResult)
+        self.assertEqual(counter.calls, 0)
+        self.assertTrue(x.is_ok())
+        self.assertEqual(x.map(lambda v: v * 2), Ok(84))
+        self.assertEqual(x.force(), Ok(42))
+        self.assertEqual(counter.calls, 1)
+
+    def test_catch(self):
+        x = Result.lazy(int, "a", catch=ValueError)
+        self.assertTrue(x.is_err())
+        self.assertIsInstance(x.force(), Err)
+        self.assertEqual(x, Err(ValueError("invalid literal for int() with base 10: 'a'")))
+        self.assertEqual(x.unwrap_or(0), 0)
+        with self.assertRaises(PanicError):
+            x.unwrap()
+
+        y = Result.lazy(int, "a", catch=TypeError)
+        with self.assertRaises(ValueError):
+            y.is_ok()
+
+    def test_combinators(self):
+        self.assertEqual(Result.lazy(lambda: Ok(2)).flatten(), Ok(2))
+        self.assertEqual(Result.lazy(lambda: Option(2)).transpose(), Option(Ok(2)))
+        self.assertEqual(list(Result.lazy(lambda: 2).iter()), [2])
+
+    def test_eq_and_repr(self):
+        x = Result.lazy(lambda: 2)
+        self.assertTrue(repr(x).startswith("Result.lazy("))
+        self.assertEqual(Ok(2), x)
+        self.assertEqual(x, Ok(2))
+        self.assertNotEqual(Err(2), x)
+        self.assertEqual(repr(x), "Ok(2)")
+
+    def test_contention(self):
+        counter = Counter(delay=0.01)
+        x = Result.lazy(counter)
+        self.assertEqual(contend(x.unwrap), [42] * THREADS)
+        self.assertEqual(counter.calls, 1)
@@ -1,5 +1,6 @@
 import contextlib
 import io
+import pickle
 import typing as t
 import unittest
 
@@ -25,6 +26,20 @@ class TestOption(unittest.TestCase):
         self.assertEqual(repr(Option("foo")), "Some('foo')")
         self.assertEqual(repr(Option(None)), "None")
 
+    def test_immutable(self):
+        x = Option(2)
+        with self.assertRaises(AttributeError):
+            x.value = 3  # type: ignore[misc]
+        with self.assertRaises(AttributeError):
+            del x.value
+        with self.assertRaises(AttributeError):
+            x.other = 3  # type: ignore[attr-defined]
+        self.assertEqual(x, Option(2))
+
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(Option(2))), Option(2))
+        self.assertEqual(pickle.loads(pickle.dumps(Option(None))), Option(None))
+
     def test_is_some(self):
         self.assertTrue(Option(2).is_some())
         self.assertFalse(Option(None).is_some())
@@ -159,3 +174,34 @@ class TestOption(unittest.TestCase):
         self.assertEqual(Option(None) ^ Option(2), Option(2))
         self.assertEqual(Option(2) ^ Option(2), Option(None))
         self.assertEqual(Option(None) ^ Option(None), Option(None))
+
+    def test_none_is_shared(self):
+        self.assertEqual(Option(None), Option(None))
+        self.assertIs(Option(2).filter(lambda x: False), Option(None).map(str))
+        self.assertIs(Option.of(int, "x"), Option(1).xor(Option(1)))
+
+    def test_zip(self):
+        self.assertEqual(Option(1).zip(Option("hi")), Option((1, "hi")))
+        self.assertEqual(Option(1).zip(Option(None)), Option(None))
+        self.assertEqual(Option(None).zip(Option("hi")), Option(None))
+
+    def test_unzip(self):
+        self.assertEqual(Option((1, "hi")).unzip(), (Option(1), Option("hi")))
+        self.assertEqual(Option(None).unzip(), (Option(None), Option(None)))
+
+    def test_flatten(self):
+        inner = Option(6)
+        self.assertIs(Option(inner).flatten(), inner)
+        self.assertEqual(Option(Option(None)).flatten(), Option(None))
+        self.assertEqual(Option(None).flatten(), Option(None))
+        self.assertEqual(Option(Option(Option(6))).flatten(), Option(Option(6)))
+
+    def test_transpose(self):
+        self.assertEqual(Option(Ok(5)).transpose(), Ok(Option(5)))
+        self.assertEqual(Option(None).transpose(), Ok(Option(None)))
+        err = Err("error")
+        self.assertIs(Option(err).transpose(), err)
+
+    def test_iter(self):
+        self.assertEqual(list(Option(4).iter()), [4])
+        self.assertEqual(list(Option(None).iter()), [])
@@ -0,0 +1,91 @@
+import sys
+import typing as t
+import unittest
+
+from optionresult import Err, Ok, PanicError, Result, provenance
+
+
+def parse(text):
+    return Result.of(int, text)
+
+
+def origin(trail: provenance.Trail) -> provenance.Site:
+    if trail.origin is None:
+        raise AssertionError("the trail has no origin")
+    return trail.origin
+
+
+# a TestCase for the type checker, but not collected as a test case itself
+if t.TYPE_CHECKING:
+    _Mixin = unittest.TestCase
+else:
+    _Mixin = object
+
+
+class ProvenanceTests(_Mixin):
+    monitoring = False
+
+    def setUp(self):
+        provenance.enable(size=4, monitoring=self.monitoring)
+        self.addCleanup(provenance.disable)
+
+    def test_creation_site(self):
+        err = parse("x")
+        trail = provenance.trail(err).unwrap()
+        self.assertEqual(origin(trail).function, "parse")
+        self.assertEqual(origin(trail).filename, __file__)
+        self.assertEqual(list(trail.steps), [])
+
+    def test_steps(self):
+        err = parse("x").map(lambda x: x + 1).and_then(lambda x: Ok(x)).inspect_err(lambda e: None)
+        trail = provenance.trail(err).unwrap()
+        self.assertEqual([name for name, _ in trail.steps], ["map", "and_then", "inspect_err"])
+        self.assertEqual({site.function if site else None for _, site in trail.steps}, {"test_steps"})
+
+    def test_map_err_continues_trail(self):
+        err = parse("x").map(str).map_err(lambda e: "bad")
+        trail = provenance.trail(err).unwrap()
+        self.assertEqual(origin(trail).function, "parse")
+        self.assertEqual([name for name, _ in trail.steps], ["map", "map_err"])
+
+    def test_ring_buffer(self):
+        err = Err("e")
+        for _ in range(10):
+            err = err.map(str)
+        self.assertEqual(len(provenance.trail(err).unwrap().steps), 4)
+
+    def test_panic(self):
+        with self.assertRaises(PanicError) as context:
+            parse("x").map(str).unwrap()
+        self.assertIsNotNone(context.exception.trail)
+        message = str(context.exception)
+        self.assertIn("Err created at", message)
+        self.assertIn(".map() at", message)
+        self.assertIn(".unwrap() at", message)
+
+    def test_disable(self):
+        provenance.disable()
+        self.assertFalse(provenance.is_enabled())
+        err = parse("x").map(str)
+        self.assertTrue(provenance.trail(err).is_none())
+        with self.assertRaises(PanicError) as context:
+            err.unwrap()
+        self.assertIsNone(context.exception.trail)
+        self.assertEqual(str(context.exception), "invalid literal for int() with base 10: 'x'")
+
+
+class TestPatchProvenance(ProvenanceTests, unittest.TestCase):
+    monitoring = False
+
+    def test_enable_twice(self):
+        with self.assertRaises(RuntimeError):
+            provenance.enable()
+
+    def test_restores_methods(self):
+        provenance.disable()
+        self.assertEqual(Err.map.__code__.co_filename, Result.of.__code__.co_filename)
+
+
+@unittest.skipUnless(hasattr(sys, "monitoring"), "requires sys.monitoring")
+class TestMonitoringProvenance(ProvenanceTests, unittest.TestCase):
+    monitoring = True
@@ -0,0 +1,173 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from optionresult import DeadlineExceeded, Err, Ok, Option, ReplayMissError, Result, replay
+from optionresult.deadline import deadline
+from optionresult.replay import Recorder, Replayer
+
+
+class Service:
+    """A deterministic stand-in for a remote dependency."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def fetch(self, key):
+        self.calls += 1
+        if key == "missing":
+            raise KeyError(key)
+        return {"key": key, "call": self.calls}
+
+
+class PairError(Exception):
+    """Pickles its formatted message as the only arg, so it cannot be rebuilt."""
+
+    def __init__(self, a, b):
+        super().__init__(f"{a}-{b}")
+
+
+def raise_pair(a, b):
+    raise PairError(a, b)
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "calls.orr")
+        self.service = Service()
+
+    def record(self, *keys):
+        with Recorder(self.path) as recorder:
+            results = [Result.of(self.service.fetch, key) for key in keys]
+        return recorder, results
+
+    def test_round_trip(self):
+        recorder, recorded = self.record("a", "missing", "b", 7)
+        self.assertEqual(len(recorder), 4)
+        self.assertEqual(self.service.calls, 4)
+        with Replayer(self.path) as replayer:
+            replayed = [Result.of(self.service.fetch, key) for key in ("a", "missing", "b", 7)]
+        self.assertEqual(len(replayer), 4)
+        self.assertEqual(self.service.calls, 4)
+        self.assertEqual(replayed, recorded)
+        self.assertIsInstance(replayed[1].value, KeyError)
+
+    def test_native_payloads(self):
+        def echo(value):
+            return value
+
+        values = [None, True, False, -5, 2.5, b"\x00raw", "text"]
+        with Recorder(self.path):
+            for value in values:
+                Result.of(echo, value)
+        with Replayer(self.path):
+            self.assertEqual([Result.of(echo, value) for value in values], [Ok(value) for value in values])
+
+    def test_repeated_keys_replay_in_order_and_cycle(self):
+        self.record("a", "b", "a")
+        with Replayer(self.path):
+            calls = [Result.of(self.service.fetch, "a").unwrap()["call"] for _ in range(3)]
+        self.assertEqual(calls, [1, 3, 1])
+
+    def test_miss(self):
+        self.record("a")
+        with Replayer(self.path):
+            result = Result.of(self.service.fetch, "z")
+        self.assertIsInstance(result.value, ReplayMissError)
+        self.assertEqual(self.service.calls, 1)
+
+    def test_custom_key(self):
+        with Recorder(self.path, key=lambda fn, args, kwargs: "fetch"):
+            Result.of(self.service.fetch, "a")
+        with Replayer(self.path, key=lambda fn, args, kwargs: "fetch") as replayer:
+            self.assertEqual(Result.of(self.service.fetch, "other").unwrap()["key"], "a")
+            self.assertTrue(replayer.next("fetch").is_some())
+            self.assertEqual(replayer.next("nope"), Option(None))
+
+    def test_failing_key(self):
+        def broken(fn, args, kwargs):
+            raise TypeError("unhashable")
+
+        with Recorder(self.path, key=broken) as recorder:
+            self.assertEqual(Result.of(str, 1), Ok("1"))
+        self.assertEqual(len(recorder), 0)
+        with Replayer(self.path, key=broken):
+            result = Result.of(str, 1)
+        self.assertIsInstance(result.value, ReplayMissError)
+        self.assertIsInstance(result.value.__cause__, TypeError)
+
+    def test_restores_result_of(self):
+        original = Result.__dict__["of"]
+        self.record("a")
+        self.assertIs(Result.__dict__["of"], original)
+        with Replayer(self.path):
+            recorder = Recorder(os.devnull)
+            self.addCleanup(recorder.close)
+            with self.assertRaises(RuntimeError):
+                recorder.__enter__()
+        self.assertIs(Result.__dict__["of"], original)
+        self.assertIsNone(replay._active)
+
+    def test_latency_simulation(self):
+        self.record("a")
+        with mock.patch.object(replay.time, "sleep") as sleep:
+            with Replayer(self.path):
+                Result.of(self.service.fetch, "a")
+            sleep.assert_not_called()
+            with Replayer(self.path, latency_scale=1e9):
+                result = Result.of(self.service.fetch, "a", within=0.5)
+                with deadline(0):
+                    expired = Result.of(self.service.fetch, "a")
+        self.assertIsInstance(result.value, DeadlineExceeded)
+        self.assertIsInstance(expired.value, DeadlineExceeded)
+        self.assertEqual(sleep.call_args_list[0], mock.call(0.5))
+
+    def test_threads(self):
+        with Recorder(self.path):
+            threads = [threading.Thread(target=lambda i=i: [Result.of(str, i) for _ in range(50)]) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        with Replayer(self.path) as replayer:
+            self.assertEqual(len(replayer), 200)
+            self.assertEqual([Result.of(str, i) for i in range(4)], [Ok(str(i)) for i in range(4)])
+
+    def test_unpicklable_values_are_still_returned(self):
+        with Recorder(self.path) as recorder:
+            live = Result.of(threading.Lock)
+            after = Result.of(str, 1)
+        self.assertTrue(live.is_ok())
+        self.assertEqual(after, Ok("1"))
+        self.assertEqual(len(recorder), 2)
+        with Replayer(self.path):
+            replayed = Result.of(threading.Lock)
+            self.assertEqual(Result.of(str, 1), Ok("1"))
+        self.assertIsInstance(replayed.value, ReplayMissError)
+        self.assertIn("could not be recorded", str(replayed.value))
+
+    def test_undecodable_values_replay_as_miss(self):
+        with Recorder(self.path):
+            recorded = Result.of(raise_pair, 1, 2)
+        self.assertEqual(str(recorded.value), "1-2")
+        with Replayer(self.path):
+            replayed = Result.of(raise_pair, 1, 2)
+        self.assertIsInstance(replayed.value, ReplayMissError)
+        self.assertIsInstance(replayed.value.__cause__, TypeError)
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a recording" * 4)
+        with self.assertRaises(ValueError):
+            Replayer(self.path)
+
+    def test_empty_recording(self):
+        with Recorder(self.path):
+            pass
+        with Replayer(self.path) as replayer:
+            self.assertEqual(len(replayer), 0)
+            self.assertEqual(Result.of(int, "1"), Err(ReplayMissError("no recorded outcome for builtins.int('1',)")))
@@ -1,9 +1,10 @@
 import contextlib
 import io
+import pickle
 import typing as t
 import unittest
 
-from optionresult import Err, Ok, Option, PanicError, Result
+from optionresult import ContextError, Err, Ok, Option, PanicError, Result
 
 UInt32 = t.NewType("UInt32", int)
 
@@ -24,6 +25,19 @@ class TestResult(unittest.TestCase):
         self.assertEqual(repr(Ok(2)), "Ok(2)")
         self.assertEqual(repr(Err("error")), "Err('error')")
 
+    def test_immutable(self):
+        for x in (Ok(2), Err("error")):
+            with self.assertRaises(AttributeError):
+                x.value = 3  # type: ignore[misc]
+            with self.assertRaises(AttributeError):
+                del x.value
+        self.assertEqual(Err[int, str]("error"), Err("error"))
+
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(Ok(2))), Ok(2))
+        self.assertEqual(pickle.loads(pickle.dumps(Err(ValueError("error")))), Err(ValueError("error")))
+        self.assertEqual(pickle.loads(pickle.dumps(Result.lazy(lambda: 2))), Ok(2))
+
     def test_of(self):
         self.assertEqual(Result.of(lambda: 123), Ok(123))
 
@@ -191,3 +205,54 @@ class TestResult(unittest.TestCase):
     def test_unwrap_or_else(self):
         self.assertEqual(Ok(2).unwrap_or_else(len), 2)
         self.assertEqual(Err("foo").unwrap_or_else(len), 3)
+
+    def test_flatten(self):
+        self.assertEqual(Ok(Ok("hello")).flatten(), Ok("hello"))
+        self.assertEqual(Ok(Err(6)).flatten(), Err(6))
+        self.assertEqual(Err(6).flatten(), Err(6))
+        self.assertEqual(Ok(Ok(Ok("hello"))).flatten(), Ok(Ok("hello")))
+
+    def test_transpose(self):
+        self.assertEqual(Ok(Option(5)).transpose(), Option(Ok(5)))
+        self.assertEqual(Ok(Option(None)).transpose(), Option(None))
+        self.assertEqual(Err("error").transpose(), Option(Err("error")))
+
+    def test_iter(self):
+        self.assertEqual(list(Ok(7).iter()), [7])
+        self.assertEqual(list(Err("nothing!").iter()), [])
+
+    def test_context(self):
+        ok = Ok(2)
+        self.assertIs(ok.context("unused"), ok)
+        self.assertIs(ok.with_context(lambda: self.fail("formatted on the Ok path")), ok)
+
+        err = Result.of(int, "x").context("parsing {!r}", "port").context("loading config")
+        self.assertEqual(str(err.unwrap_err()), "loading config: parsing 'port': invalid literal for int() with base 10: 'x'")
+        self.assertEqual(repr(Err("bad").context("loading")), "Err(ContextError('loading', 'bad'))")
+        self.assertIsInstance(err.unwrap_err().root_cause, ValueError)
+        self.assertEqual([e.message for e in err.unwrap_err().chain() if isinstance(e, ContextError)], ["loading config", "parsing 'port'"])
+        self.assertIs(t.cast(ContextError, err.unwrap_err().source).__cause__, err.unwrap_err().root_cause)
+
+        with self.assertRaises(PanicError) as context:
+            Err(13).context("code").expect("failed")
+        self.assertEqual("failed: code: 13", str(context.exception))
+
+    def test_with_context(self):
+        calls = []
+
+        def describe():
+            calls.append(None)
+            return "reading address.txt"
+
+        err = Err("missing").with_context(describe)
+        self.assertEqual(calls, [])
+        self.assertEqual(str(err.unwrap_err()), "reading address.txt: missing")
+        self.assertEqual(str(err.unwrap_err()), "reading address.txt: missing")
+        self.assertEqual(len(calls), 1)
+
+    def test_context_eq(self):
+        self.assertEqual(Err("bad").context("loading"), Err("bad").with_context(lambda: "loading"))
+        self.assertEqual(Err(ValueError("bad")).context("{}", "loading"), Err(ValueError("bad")).context("loading"))
+        self.assertNotEqual(Err("bad").context("loading"), Err("bad").context("saving"))
+        self.assertNotEqual(Err("bad").context("loading"), Err("worse").context("loading"))
+        self.assertNotEqual(Err("bad").context("loading"), Err("bad"))
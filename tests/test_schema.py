@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import dataclasses
+import enum
+import typing as t
+import unittest
+
+from optionresult import Err, FieldError, Ok, SchemaError, compile_parser
+from optionresult.schema import parse
+
+
+class Color(enum.Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: float = 0.0
+
+
+@dataclasses.dataclass
+class Shape:
+    name: str
+    points: t.List[Point]
+    color: Color = Color.RED
+    tags: t.Dict[str, int] = dataclasses.field(default_factory=dict)
+    label: t.Optional[str] = None
+    kind: t.Literal["open", "closed"] = "open"
+    id: t.Union[int, str] = 0
+
+
+@dataclasses.dataclass
+class Node:
+    value: int
+    children: t.List[Node] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class Positive:
+    x: int
+
+    def __post_init__(self) -> None:
+        if self.x < 0:
+            raise ValueError("must be >= 0")
+
+
+@dataclasses.dataclass
+class Bag:
+    items: t.Set[t.List[int]]
+    positive: t.List[Positive] = dataclasses.field(default_factory=list)
+    index: t.Dict[t.List[int], int] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass
+class Scaled:
+    x: int
+    scale: dataclasses.InitVar[int] = 1
+
+    def __post_init__(self, scale: int) -> None:
+        self.x *= scale
+
+
+@dataclasses.dataclass
+class Offset(Scaled):
+    shift: dataclasses.InitVar[t.Optional[int]] = None
+
+    def __post_init__(self, scale: int, shift: t.Optional[int]) -> None:
+        super().__post_init__(scale)
+        self.x += shift or 0
+
+
+@dataclasses.dataclass
+class Caller:
+    callee: t.Optional[Callee]
+    callback: t.Callable[[], None]
+
+
+@dataclasses.dataclass
+class Callee:
+    caller: t.Optional[Caller]
+
+
+class Movie(t.TypedDict):
+    title: str
+    year: int
+
+
+class PartialMovie(t.TypedDict, total=False):
+    title: str
+    rating: float
+
+
+class TestSchema(unittest.TestCase):
+    def test_ok(self):
+        result = parse(Point, {"x": 1, "y": 2.5, "extra": None})
+        self.assertEqual(result, Ok(Point(1, 2.5)))
+        self.assertEqual(parse(Point, {"x": 1}), Ok(Point(1, 0.0)))
+
+    def test_coercion(self):
+        self.assertEqual(parse(Point, {"x": "3", "y": 2}), Ok(Point(3, 2.0)))
+        self.assertEqual(parse(Point, {"x": 4.0}), Ok(Point(4)))
+        self.assertTrue(parse(Point, {"x": 4.5}).is_err())
+        self.assertTrue(parse(Point, {"x": True}).is_err())
+
+    def test_nested(self):
+        payload = {
+            "name": "tri",
+            "points": [{"x": 0}, {"x": 1, "y": 1}],
+            "color": "blue",
+            "tags": {"a": "1"},
+            "kind": "closed",
+            "id": "abc",
+        }
+        expected = Shape("tri", [Point(0), Point(1, 1.0)], Color.BLUE, {"a": 1}, None, "closed", "abc")
+        self.assertEqual(parse(Shape, payload), Ok(expected))
+
+    def test_first_error(self):
+        result = parse(Shape, {"name": 1, "points": [{"x": "a"}]})
+        self.assertEqual(result, Err(SchemaError([FieldError(("name",), "expected str, got int")])))
+
+    def test_collect_all(self):
+        result = parse(Shape, {"name": 1, "points": [{"x": 0}, {"x": "a"}, {}], "color": "green", "kind": "x"}, collect_all=True)
+        errors = result.unwrap_err().errors
+        self.assertEqual(
+            [error.path for error in errors],
+            [("name",), ("points", 1, "x"), ("points", 2, "x"), ("color",), ("kind",)],
+        )
+        self.assertEqual(str(errors[1]), "points[1].x: invalid int literal 'a'")
+        self.assertEqual(str(errors[2]), "points[2].x: missing required field")
+
+    def test_not_a_mapping(self):
+        self.assertEqual(str(parse(Point, [1]).unwrap_err()), "<root>: expected a mapping, got list")
+
+    def test_recursive(self):
+        result = parse(Node, {"value": 1, "children": [{"value": 2, "children": [{"value": "x"}]}]})
+        self.assertEqual(result.unwrap_err().errors[0].path, ("children", 0, "children", 0, "value"))
+        self.assertEqual(parse(Node, {"value": 1, "children": [{"value": 2}]}), Ok(Node(1, [Node(2)])))
+
+    def test_typeddict(self):
+        self.assertEqual(parse(Movie, {"title": "Alien", "year": "1979"}), Ok({"title": "Alien", "year": 1979}))
+        self.assertEqual(parse(Movie, {"title": "Alien"}).unwrap_err().errors, [FieldError(("year",), "missing required field")])
+        self.assertEqual(parse(PartialMovie, {"rating": 5}), Ok({"rating": 5.0}))
+
+    def test_construction_errors(self):
+        self.assertEqual(parse(Positive, {"x": -1}), Err(SchemaError([FieldError((), "must be >= 0")])))
+        result = parse(Bag, {"items": [], "positive": [{"x": 1}, {"x": -1}]})
+        self.assertEqual(result.unwrap_err().errors, [FieldError(("positive", 1), "must be >= 0")])
+        result = parse(Bag, {"items": [[1], [2]]})
+        self.assertEqual(result.unwrap_err().errors[0].path, ("items",))
+        self.assertIn("unhashable", result.unwrap_err().errors[0].message)
+        result = parse(Bag, {"items": [], "index": {(1, 2): 1}}, collect_all=True)
+        self.assertEqual(result.unwrap_err().errors[0].path, ("index", (1, 2)))
+
+    def test_init_var(self):
+        self.assertEqual(parse(Scaled, {"x": 2, "scale": "3"}), Ok(Scaled(6)))
+        self.assertEqual(parse(Scaled, {"x": 2}), Ok(Scaled(2)))
+        self.assertEqual(parse(Scaled, {"x": 2, "scale": "a"}).unwrap_err().errors[0].path, ("scale",))
+        self.assertEqual(parse(Offset, {"x": 2, "scale": 3, "shift": 1}), Ok(Offset(7)))
+
+    def test_cached(self):
+        self.assertIs(compile_parser(Point), compile_parser(Point))
+        self.assertIsNot(compile_parser(Point), compile_parser(Point, collect_all=True))
+
+    def test_unsupported(self):
+        with self.assertRaises(TypeError):
+            compile_parser(int)  # type: ignore[arg-type]
+
+        @dataclasses.dataclass
+        class Bad:
+            value: t.Callable[[], None]
+
+        with self.assertRaises(TypeError):
+            compile_parser(Bad)
+
+    def test_failed_group_is_not_cached(self):
+        # compiling Caller compiles Callee first, which must not outlive Caller's failure
+        with self.assertRaises(TypeError):
+            compile_parser(Caller)
+        with self.assertRaises(TypeError):
+            compile_parser(Callee)
@@ -0,0 +1,85 @@
+import multiprocessing
+import pickle
+import sys
+import unittest
+from unittest import mock
+
+from optionresult import Err, Ok
+from optionresult.shm import SharedResults, pack_results
+
+RESULTS = [
+    Ok(None),
+    Ok(True),
+    Err(False),
+    Ok(-(2**63)),
+    Ok(2**70),
+    Ok(1.5),
+    Err(b"\x00raw"),
+    Ok("héllo"),
+    Err(ValueError("boom")),
+    Ok({"nested": [1, 2]}),
+    Ok(b""),
+]
+
+
+def consume(name, queue):
+    with SharedResults.attach(name) as shared:
+        queue.put([result for result in shared])
+
+
+class TestSharedResults(unittest.TestCase):
+    def setUp(self):
+        self.shared = pack_results(RESULTS)
+        self.addCleanup(self.shared.unlink)
+        self.addCleanup(self.shared.close)
+
+    def test_roundtrip(self):
+        self.assertEqual(len(self.shared), len(RESULTS))
+        self.assertEqual(list(self.shared), RESULTS)
+        self.assertEqual([type(result) for result in self.shared], [type(result) for result in RESULTS])
+
+    def test_getitem(self):
+        self.assertEqual(self.shared[7], Ok("héllo"))
+        self.assertEqual(self.shared[-1], Ok(b""))
+        self.assertEqual(self.shared[1:3], [Ok(True), Err(False)])
+        with self.assertRaises(IndexError):
+            self.shared[len(RESULTS)]
+
+    def test_read_only(self):
+        with self.assertRaises(TypeError):
+            self.shared._view()[0] = 0
+
+    def test_attach(self):
+        other = SharedResults.attach(self.shared.name)
+        self.assertEqual(list(other), RESULTS)
+        other.close()
+        with self.assertRaises(ValueError):
+            other[0]
+
+    def test_unclosed_view_releases_its_export(self):
+        unraisable = []
+        with mock.patch.object(sys, "unraisablehook", unraisable.append):
+            other = SharedResults.attach(self.shared.name)
+            self.assertEqual(other[0], Ok(None))
+            del other
+        self.assertEqual(unraisable, [])
+
+    def test_pickle_sends_name(self):
+        self.assertLess(len(pickle.dumps(self.shared)), 200)
+        other = pickle.loads(pickle.dumps(self.shared))
+        self.assertEqual(list(other), RESULTS)
+        other.close()
+
+    def test_empty(self):
+        with pack_results([]) as shared:
+            self.assertEqual(list(shared), [])
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "requires fork")
+    def test_other_process(self):
+        ctx = multiprocessing.get_context("fork")
+        queue = ctx.Queue()
+        process = ctx.Process(target=consume, args=(self.shared.name, queue))
+        process.start()
+        self.assertEqual(queue.get(timeout=10), RESULTS)
+        process.join(10)
+        self.assertEqual(process.exitcode, 0)